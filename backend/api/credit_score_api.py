@@ -75,6 +75,7 @@ class ScoreCalculationResponse(BaseModel):
     success: bool
     address: str
     credit_score: Optional[Dict[str, Any]] = None
+    score_history: Optional[List[int]] = None
     contract_transactions: Optional[Dict[str, str]] = None
     processing_time_seconds: Optional[float] = None
     ai_analysis: Optional[Dict[str, Any]] = None  # ✅ Changed from str to Dict[str, Any]
@@ -400,6 +401,7 @@ async def calculate_credit_score(
             success=True,
             address=request.address,
             credit_score=contract_result.get('credit_score'),
+            score_history=contract_result.get('score_history'),
             contract_transactions=contract_result.get('transactions'),
             processing_time_seconds=round(processing_time, 2),
             ai_analysis=ai_analysis,
@@ -725,6 +727,8 @@ async def startup_event():
         logger.info(f"📄 Contract: {config.CONTRACT_ADDRESS}")
         logger.info(f"🌐 Server: http://{config.API_HOST}:{config.API_PORT}")
         logger.info(f"🤖 AI Analysis: {'✅ Enabled' if gemini_ai else '❌ Disabled'}")
+        if gemini_ai and not gemini_ai.use_llm:
+            logger.info("🤖 Gemini LLM analysis disabled - AI analyses use the rule-based summaries (set GEMINI_USE_LLM=true to enable)")
         logger.info(f"⏰ Rate Limiting: API={config.RATE_LIMIT_PER_MINUTE}/min, Contract=30min cooldown")
         
         # Test contract connection with fresh import
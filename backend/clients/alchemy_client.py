@@ -947,8 +947,7 @@ async def test_enhanced_alchemy_client():
         
     except Exception as e:
         print(f"❌ Error testing Alchemy client: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Alchemy client test traceback")
         return False
 
 
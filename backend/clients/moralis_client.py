@@ -914,8 +914,7 @@ async def test_enhanced_moralis_client():
         
     except Exception as e:
         print(f"❌ Error testing Moralis client: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Moralis client test traceback")
         return False
 
 
@@ -3,6 +3,7 @@ import asyncio
 from typing import Dict, List, Any, Optional, Tuple
 import os
 import json
+import time
 from datetime import datetime
 from loguru import logger
 
@@ -63,6 +64,7 @@ class MultiChainDataAggregator:
         logger.info(f"🚀 Starting comprehensive data collection for address: {address}")
         
         start_time = datetime.now()
+        start_counter = time.perf_counter()
         
         try:
             # Validate address format
@@ -81,7 +83,7 @@ class MultiChainDataAggregator:
             # Add aggregation metadata
             structured_data['aggregation_metadata'] = self._generate_aggregation_metadata(collection_results, start_time)
             
-            collection_time = (datetime.now() - start_time).total_seconds()
+            collection_time = time.perf_counter() - start_counter
             logger.info(f"✅ Data collection completed in {collection_time:.2f} seconds for {address}")
             
             return structured_data
@@ -90,6 +92,23 @@ class MultiChainDataAggregator:
             logger.error(f"❌ Error in comprehensive data collection for {address}: {str(e)}")
             return self._get_empty_comprehensive_data(address, start_time, str(e))
     
+    async def fetch_batch_raw(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch comprehensive data for a batch of addresses
+        Duplicate addresses are collected once and concurrent collections are bounded by max_concurrent_requests
+        """
+        unique_addresses = list(dict.fromkeys(address.lower() for address in addresses))
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def fetch_one(address: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_user_comprehensive_data(address)
+        
+        logger.info(f"🚀 Starting batch data collection for {len(unique_addresses)} addresses")
+        results = await asyncio.gather(*(fetch_one(address) for address in unique_addresses))
+        
+        return dict(zip(unique_addresses, results))
+    
     async def _collect_all_data_with_comprehensive_retry(self, address: str) -> Dict[str, Any]:
         """Enhanced data collection with comprehensive retry logic and parallel processing"""
         
@@ -220,7 +239,7 @@ class MultiChainDataAggregator:
         }
     async def _collect_data_with_retry(self, source_name: str, address: str, collection_func) -> dict:
         """Enhanced data collection with retry logic and timeout handling."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         max_retries = 3
         retry_delay = 3
 
@@ -234,7 +253,7 @@ class MultiChainDataAggregator:
                     timeout=60
                 )
 
-                collection_time = (datetime.now() - start_time).total_seconds()
+                collection_time = time.perf_counter() - start_time
                 logger.info(f"✅ {source_name} collection successful in {collection_time:.2f}s")
 
                 return {
@@ -245,7 +264,7 @@ class MultiChainDataAggregator:
                     'collection_time': collection_time
                 }
             except asyncio.TimeoutError:
-                collection_time = (datetime.now() - start_time).total_seconds()
+                collection_time = time.perf_counter() - start_time
                 logger.warning(f"⏰ {source_name} attempt {attempt + 1} timed out after {collection_time:.2f}s")
 
                 if attempt == max_retries - 1:
@@ -258,7 +277,7 @@ class MultiChainDataAggregator:
                     }
                 await asyncio.sleep(retry_delay)
             except Exception as e:
-                collection_time = (datetime.now() - start_time).total_seconds()
+                collection_time = time.perf_counter() - start_time
                 logger.error(f"❌ {source_name} attempt {attempt + 1} error: {str(e)}")
 
                 if attempt == max_retries - 1:
@@ -856,12 +875,15 @@ async def test_complete_multi_chain_aggregator():
     print("🚀 Testing Complete Multi-Chain Data Aggregator")
     print("=" * 70)
     
+    # Collect all test addresses as one batch (bounded by max_concurrent_requests), then report in order
+    results = await aggregator.fetch_batch_raw(test_addresses)
+    
     for i, address in enumerate(test_addresses, 1):
         print(f"\n📊 Test {i}: Processing address {address}")
         print("-" * 50)
         
         try:
-            comprehensive_data = await aggregator.fetch_user_comprehensive_data(address)
+            comprehensive_data = results[address.lower()]
             
             # Display results
             print(f"✅ Address: {comprehensive_data['address']}")
@@ -897,8 +919,7 @@ async def test_complete_multi_chain_aggregator():
             
         except Exception as e:
             print(f"❌ Error processing {address}: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Aggregator test traceback for {address}")
     
     print(f"\n🎉 Multi-Chain Aggregator Testing Completed!")
 
@@ -7,6 +7,16 @@ import json
 from loguru import logger
 from datetime import datetime
 
+# orjson is optional - fall back to the stdlib encoder for pretty-printed output
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
 class ZapperClient:
     """
     Enhanced Zapper API client for comprehensive DeFi portfolio analysis
@@ -735,12 +745,11 @@ async def test_enhanced_zapper_client():
                 print(f"   {category}: {data['count']} protocols (${data['value_usd']:,.2f})")
         
         print("\n📊 Detailed Results:")
-        print(json.dumps(metrics, indent=2, default=str))
+        print(_dumps(metrics))
         
     except Exception as e:
         print(f"❌ Error testing Zapper client: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Zapper client test traceback")
 
 if __name__ == "__main__":
     import asyncio
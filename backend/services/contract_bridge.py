@@ -9,8 +9,12 @@ from web3.middleware import ExtraDataToPOAMiddleware
 from web3.exceptions import Web3Exception
 from eth_account import Account
 from eth_typing import Address
+from eth_utils import is_address, to_checksum_address
+from eth_abi import decode, encode
 import json
 from dataclasses import dataclass
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timezone
 import time
 
@@ -18,7 +22,40 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# previewScore is pure, so results can be reused for identical metrics
+# Module-level since the API creates a bridge per request; LRU-bounded to PREVIEW_CACHE_SIZE
+PREVIEW_CACHE_SIZE = 1024
+_preview_cache: "OrderedDict[Tuple[int, str, BehavioralMetrics], Tuple[int, int]]" = OrderedDict()
+
+# Multicall3 is deployed at the same address on Scroll Sepolia and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# ABI types of the CreditScoreRegistry structs
+BEHAVIORAL_METRICS_ABI_TYPE = "(" + ",".join(["uint256"] * 22) + ")"
+CREDIT_SCORE_ABI_TYPE = "(uint256,uint256,uint256,uint256,uint256,uint256,uint256,uint256,uint256,bool)"
+
+# CreditScoreRegistry function signatures used when building calldata by hand
+_SIGS = {
+    'updateBehavioralData': f"updateBehavioralData(address,{BEHAVIORAL_METRICS_ABI_TYPE})",
+    'getCreditScore': "getCreditScore(address)",
+    'getScoreHistory': "getScoreHistory(address)"
+}
+
+# 4-byte selectors computed once at import
+_SELECTORS = {name: bytes(Web3.keccak(text=sig)[:4]) for name, sig in _SIGS.items()}
+
+# Contract info per (chain, registry) and provider authorization per (chain, registry, provider)
+# PROTOCOL_VERSION/owner never change; provider authorization is re-checked after the TTL
+AUTHORIZATION_CACHE_TTL = 300
+_static_contract_info: Dict[Tuple[int, str], Dict[str, Any]] = {}
+_authorization_cache: Dict[Tuple[int, str, str], Tuple[float, bool]] = {}
+
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address, caching the keccak256 step for repeat users"""
+    return to_checksum_address(address)
+
+@dataclass(slots=True, frozen=True)
 class BehavioralMetrics:
     """Behavioral metrics structure matching the smart contract"""
     transactionFrequency: int
@@ -44,7 +81,7 @@ class BehavioralMetrics:
     activityConsistencyScore: int
     engagementScore: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreditScore:
     """Credit score structure matching the smart contract"""
     totalScore: int
@@ -64,19 +101,33 @@ class ContractBridge:
     Handles all contract interactions for behavioral data updates and credit score calculations
     """
     
-    def __init__(self):
+    def __init__(self, verify_on_init: Optional[bool] = None):
         """Initialize the contract bridge with environment configuration"""
         self.w3 = None
         self.account = None
         self.registry_contract = None
+        self.multicall_contract = None
+        self.multicall_address = os.getenv('MULTICALL3_ADDRESS', MULTICALL3_ADDRESS)
         self.registry_address = os.getenv('DEPLOYED_REGISTRY_ADDRESS', "0x8e9288aD536Ee22Df91026BE96cB1deE904C05eF")
         self.chain_id = int(os.getenv('CHAIN_ID', '534351'))  # Scroll Sepolia
         
+        # Boot-time RPC checks are opt-in so the bridge is usable after zero RPC calls
+        # (on by default when debugging, unless explicitly disabled)
+        if verify_on_init is None:
+            verify_on_init = (
+                os.getenv('CONTRACT_VERIFY_ON_INIT', 'false').lower() == 'true'
+                or logger.isEnabledFor(logging.DEBUG)
+            )
+        self.verify_on_init = verify_on_init
+        
         # Load configuration from environment
         self._load_config()
         self._setup_web3()
         self._setup_contract()
         
+        if self.verify_on_init:
+            self._verify_connection()
+        
     def _load_config(self):
         """Load configuration from environment variables"""
         # Network configuration
@@ -94,6 +145,10 @@ class ContractBridge:
         self.gas_price = int(os.getenv('SCROLL_SEPOLIA_GAS_PRICE', '100000000'))  # 0.1 gwei
         self.gas_limit = int(os.getenv('SCROLL_SEPOLIA_GAS_LIMIT', '500000'))
         
+        # Receipt polling - align with block time instead of web3's 0.1s default
+        self.block_time = float(os.getenv('SCROLL_SEPOLIA_BLOCK_TIME', '3'))
+        self.receipt_timeout = int(os.getenv('TX_RECEIPT_TIMEOUT', '120'))
+        
         # Protocol configuration
         self.min_update_interval = int(os.getenv('MINIMUM_UPDATE_INTERVAL', '1800'))  # 30 minutes
         
@@ -109,22 +164,7 @@ class ContractBridge:
             
             # Setup account
             self.account = Account.from_key(self.private_key)
-            
-            # Test connection
-            if not self.w3.is_connected():
-                raise ConnectionError("Failed to connect to Scroll Sepolia")
-                
-            latest_block = self.w3.eth.get_block('latest')
-            logger.info(f"Connected to Scroll Sepolia - Latest block: {latest_block.number}")
             logger.info(f"Using account: {self.account.address}")
-            
-            # Check balance
-            balance = self.w3.eth.get_balance(self.account.address)
-            balance_eth = self.w3.from_wei(balance, 'ether')
-            logger.info(f"Account balance: {balance_eth:.4f} ETH")
-            
-            if balance_eth < 0.001:
-                logger.warning("Low account balance - may not be sufficient for transactions")
                 
         except Exception as e:
             logger.error(f"Failed to setup Web3: {e}")
@@ -142,12 +182,41 @@ class ContractBridge:
                 abi=contract_abi
             )
             
+            # Multicall3 instance for batching view calls into a single eth_call
+            self.multicall_contract = self.w3.eth.contract(
+                address=self.multicall_address,
+                abi=self._get_multicall_abi()
+            )
+            
+            logger.info(f"Contract address: {self.registry_address}")
+                
+        except Exception as e:
+            logger.error(f"Failed to setup contract: {e}")
+            raise
+    
+    def _verify_connection(self):
+        """Check network connection, account balance and contract state"""
+        try:
+            # Test connection
+            if not self.w3.is_connected():
+                raise ConnectionError("Failed to connect to Scroll Sepolia")
+                
+            latest_block = self.w3.eth.get_block('latest')
+            logger.info(f"Connected to Scroll Sepolia - Latest block: {latest_block.number}")
+            
+            # Check balance
+            balance = self.w3.eth.get_balance(self.account.address)
+            balance_eth = self.w3.from_wei(balance, 'ether')
+            logger.info(f"Account balance: {balance_eth:.4f} ETH")
+            
+            if balance_eth < 0.001:
+                logger.warning("Low account balance - may not be sufficient for transactions")
+            
             # Test contract connection
             protocol_version = self.registry_contract.functions.PROTOCOL_VERSION().call()
             owner = self.registry_contract.functions.owner().call()
             
             logger.info(f"Contract connected - Version: {protocol_version}, Owner: {owner}")
-            logger.info(f"Contract address: {self.registry_address}")
             
             # Verify authorization
             is_authorized = self.registry_contract.functions.authorizedDataProviders(self.account.address).call()
@@ -157,9 +226,14 @@ class ContractBridge:
                 logger.warning("Account is not authorized as a data provider")
                 
         except Exception as e:
-            logger.error(f"Failed to setup contract: {e}")
+            logger.error(f"Failed to verify contract connection: {e}")
             raise
     
+    async def warmup(self):
+        """Run the connection and contract checks skipped at init"""
+        # The checks are blocking RPC calls - keep them off the event loop
+        await asyncio.to_thread(self._verify_connection)
+    
     def _get_contract_abi(self) -> List[Dict]:
         """Get the contract ABI from deployment artifacts or define it manually"""
         # Contract ABI for CreditScoreRegistry (key functions only)
@@ -309,6 +383,39 @@ class ContractBridge:
             }
         ]
     
+    def _get_multicall_abi(self) -> List[Dict]:
+        """Get the Multicall3 ABI (aggregate3 only)"""
+        return [
+            {
+                "inputs": [
+                    {
+                        "components": [
+                            {"internalType": "address", "name": "target", "type": "address"},
+                            {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                            {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                        ],
+                        "internalType": "struct Multicall3.Call3[]",
+                        "name": "calls",
+                        "type": "tuple[]"
+                    }
+                ],
+                "name": "aggregate3",
+                "outputs": [
+                    {
+                        "components": [
+                            {"internalType": "bool", "name": "success", "type": "bool"},
+                            {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                        ],
+                        "internalType": "struct Multicall3.Result[]",
+                        "name": "returnData",
+                        "type": "tuple[]"
+                    }
+                ],
+                "stateMutability": "payable",
+                "type": "function"
+            }
+        ]
+    
     def _convert_metrics_to_tuple(self, metrics: BehavioralMetrics) -> tuple:
         """Convert BehavioralMetrics to tuple for contract call"""
         return (
@@ -377,17 +484,21 @@ class ContractBridge:
         
         return transaction
     
+    def _sign_transaction(self, transaction: Dict) -> bytes:
+        """Sign a transaction and return the raw bytes"""
+        signed_transaction = self.account.sign_transaction(transaction)
+        
+        # Handle both old and new Web3.py versions for rawTransaction
+        try:
+            return signed_transaction.raw_transaction  # Web3.py v6+
+        except AttributeError:
+            return signed_transaction.rawTransaction   # Web3.py v5 and older
+    
     def _send_transaction(self, transaction: Dict) -> str:
         """Sign and send transaction"""
         try:
             # Sign transaction
-            signed_transaction = self.account.sign_transaction(transaction)
-            
-            # Handle both old and new Web3.py versions for rawTransaction
-            try:
-                raw_transaction = signed_transaction.raw_transaction  # Web3.py v6+
-            except AttributeError:
-                raw_transaction = signed_transaction.rawTransaction   # Web3.py v5 and older
+            raw_transaction = self._sign_transaction(transaction)
             
             # Send transaction
             tx_hash = self.w3.eth.send_raw_transaction(raw_transaction)
@@ -395,8 +506,12 @@ class ContractBridge:
             
             logger.info(f"Transaction sent: {tx_hash_hex}")
             
-            # Wait for confirmation
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            # Wait for confirmation (poll once per block)
+            receipt = self.w3.eth.wait_for_transaction_receipt(
+                tx_hash,
+                timeout=self.receipt_timeout,
+                poll_latency=self.block_time
+            )
             
             if receipt.status == 1:
                 logger.info(f"Transaction confirmed: {tx_hash_hex} (Block: {receipt.blockNumber})")
@@ -414,10 +529,10 @@ class ContractBridge:
             logger.info(f"Updating behavioral data for user: {user_address}")
             
             # Validate user address
-            if not self.w3.is_address(user_address):
+            if not is_address(user_address):
                 raise ValueError(f"Invalid user address: {user_address}")
             
-            user_address = self.w3.to_checksum_address(user_address)
+            user_address = _checksum(user_address)
             
             # Convert metrics to contract format
             metrics_tuple = self._convert_metrics_to_tuple(metrics)
@@ -448,16 +563,163 @@ class ContractBridge:
             logger.error(f"Failed to update behavioral data: {e}")
             raise
     
+    async def bulk_update_behavioral_data(self, users_metrics: List[Tuple[str, BehavioralMetrics]]) -> List[Dict[str, Any]]:
+        """
+        Update behavioral data for many users at once
+        Signs all transactions locally with sequential nonces, submits them in a single
+        JSON-RPC batch of eth_sendRawTransaction calls and waits for receipts concurrently.
+        Nonces left unused by rejected submissions are filled with zero-value self-transfers
+        so the accepted transactions behind them can still be mined.
+        """
+        results: List[Dict[str, Any]] = []
+        if not users_metrics:
+            return results
+        
+        try:
+            logger.info(f"Bulk updating behavioral data for {len(users_metrics)} users")
+            
+            # Fetch nonce and gas price once for the whole batch
+            nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+            gas_price = max(self.w3.eth.gas_price * 110 // 100, self.gas_price)  # 10% buffer
+            
+            # Build and sign every transaction in-process
+            raw_transactions = []
+            for user_address, metrics in users_metrics:
+                if not is_address(user_address):
+                    results.append({'user_address': user_address, 'success': False,
+                                    'error': f"Invalid user address: {user_address}"})
+                    continue
+                
+                user_address = _checksum(user_address)
+                calldata = _SELECTORS['updateBehavioralData'] + encode(
+                    ['address', BEHAVIORAL_METRICS_ABI_TYPE],
+                    [user_address, self._convert_metrics_to_tuple(metrics)]
+                )
+                transaction = {
+                    'from': self.account.address,
+                    'to': self.registry_address,
+                    'data': Web3.to_hex(calldata),
+                    'value': 0,
+                    'nonce': nonce,
+                    'gas': self.gas_limit,
+                    'gasPrice': gas_price,
+                    'chainId': self.chain_id
+                }
+                
+                result = {'user_address': user_address, 'success': False, 'tx_hash': None}
+                results.append(result)
+                raw_transactions.append((result, nonce, Web3.to_hex(self._sign_transaction(transaction))))
+                nonce += 1
+            
+            if not raw_transactions:
+                return results
+            
+            # Submit all signed transactions in one batched request
+            responses = self.w3.provider.make_batch_request([
+                ('eth_sendRawTransaction', [raw_hex]) for _, _, raw_hex in raw_transactions
+            ])
+            
+            # A node that rejects the whole batch answers with a single error object
+            if not isinstance(responses, list):
+                error = responses.get('error', responses) if isinstance(responses, dict) else responses
+                for result, _, _ in raw_transactions:
+                    result['error'] = f"Not submitted - batch rejected: {error}"
+                logger.error(f"Bulk update batch rejected: {error}")
+                return results
+            
+            pending = []
+            rejected_nonces = []
+            for (result, tx_nonce, _), response in zip(raw_transactions, responses):
+                if response.get('error'):
+                    result['error'] = str(response['error'])
+                    rejected_nonces.append(tx_nonce)
+                else:
+                    result['tx_hash'] = response['result']
+                    result['nonce'] = tx_nonce
+                    pending.append(result)
+            
+            # Transactions accepted after a rejected one wait on its nonce - fill those gaps
+            if rejected_nonces and pending:
+                stuck_from = self._fill_nonce_gaps(rejected_nonces, pending[-1]['nonce'], gas_price)
+                if stuck_from is not None:
+                    for result in pending:
+                        if result['nonce'] > stuck_from:
+                            result['error'] = f"Not mined - nonce {stuck_from} could not be filled"
+                    pending = [result for result in pending if result['nonce'] < stuck_from]
+            
+            logger.info(f"Submitted {len(pending)}/{len(raw_transactions)} transactions in batch")
+            
+            # Wait for all receipts in parallel
+            receipts = await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.w3.eth.wait_for_transaction_receipt,
+                    result['tx_hash'],
+                    timeout=self.receipt_timeout,
+                    poll_latency=self.block_time
+                ) for result in pending
+            ), return_exceptions=True)
+            
+            for result, receipt in zip(pending, receipts):
+                if isinstance(receipt, Exception):
+                    result['error'] = str(receipt)
+                elif receipt.status == 1:
+                    result['success'] = True
+                else:
+                    result['error'] = f"Transaction failed: {result['tx_hash']}"
+            
+            logger.info(f"Bulk update finished: {sum(r['success'] for r in results)}/{len(results)} succeeded")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk update behavioral data: {e}")
+            raise
+    
+    def _fill_nonce_gaps(self, rejected_nonces: List[int], highest_nonce: int, gas_price: int) -> Optional[int]:
+        """
+        Submit zero-value self-transfers for rejected nonces below highest_nonce
+        
+        Returns:
+            Optional[int]: the lowest nonce that could not be filled, or None if every gap was filled
+        """
+        gaps = [gap for gap in rejected_nonces if gap < highest_nonce]
+        if not gaps:
+            return None
+        
+        logger.warning(f"Filling {len(gaps)} nonce gap(s) left by rejected transactions: {gaps}")
+        fillers = [
+            Web3.to_hex(self._sign_transaction({
+                'from': self.account.address,
+                'to': self.account.address,
+                'value': 0,
+                'nonce': gap,
+                'gas': 21000,
+                'gasPrice': gas_price,
+                'chainId': self.chain_id
+            })) for gap in gaps
+        ]
+        
+        responses = self.w3.provider.make_batch_request([
+            ('eth_sendRawTransaction', [raw_hex]) for raw_hex in fillers
+        ])
+        if not isinstance(responses, list):
+            return gaps[0]
+        
+        for gap, response in zip(gaps, responses):
+            if response.get('error'):
+                logger.error(f"Failed to fill nonce gap {gap}: {response['error']}")
+                return gap
+        return None
+    
     async def calculate_credit_score(self, user_address: str) -> str:
         """Calculate credit score for a user on-chain"""
         try:
             logger.info(f"Calculating credit score for user: {user_address}")
             
             # Validate user address
-            if not self.w3.is_address(user_address):
+            if not is_address(user_address):
                 raise ValueError(f"Invalid user address: {user_address}")
             
-            user_address = self.w3.to_checksum_address(user_address)
+            user_address = _checksum(user_address)
             
             # Prepare contract function call
             function_call = self.registry_contract.functions.calculateCreditScore(user_address)
@@ -486,10 +748,10 @@ class ContractBridge:
         """Get credit score for a user from contract"""
         try:
             # Validate user address
-            if not self.w3.is_address(user_address):
+            if not is_address(user_address):
                 raise ValueError(f"Invalid user address: {user_address}")
             
-            user_address = self.w3.to_checksum_address(user_address)
+            user_address = _checksum(user_address)
             
             # Call contract
             score_data = self.registry_contract.functions.getCreditScore(user_address).call()
@@ -518,6 +780,14 @@ class ContractBridge:
     async def preview_score(self, metrics: BehavioralMetrics) -> Tuple[int, int]:
         """Preview credit score calculation without executing transaction"""
         try:
+            # previewScore is a pure function - reuse results for identical metrics
+            cache_key = (self.chain_id, self.registry_address.lower(), metrics)
+            cached = _preview_cache.get(cache_key)
+            if cached is not None:
+                _preview_cache.move_to_end(cache_key)
+                logger.info(f"Score preview (cached): {cached[0]} (confidence: {cached[1]}%)")
+                return cached
+            
             # Convert metrics to contract format
             metrics_tuple = self._convert_metrics_to_tuple(metrics)
             
@@ -527,6 +797,10 @@ class ContractBridge:
             estimated_score, confidence = result
             logger.info(f"Score preview: {estimated_score} (confidence: {confidence}%)")
             
+            _preview_cache[cache_key] = (estimated_score, confidence)
+            if len(_preview_cache) > PREVIEW_CACHE_SIZE:
+                _preview_cache.popitem(last=False)
+            
             return estimated_score, confidence
             
         except Exception as e:
@@ -537,10 +811,10 @@ class ContractBridge:
         """Get score history for a user"""
         try:
             # Validate user address
-            if not self.w3.is_address(user_address):
+            if not is_address(user_address):
                 raise ValueError(f"Invalid user address: {user_address}")
             
-            user_address = self.w3.to_checksum_address(user_address)
+            user_address = _checksum(user_address)
             
             # Call contract
             history = self.registry_contract.functions.getScoreHistory(user_address).call()
@@ -552,6 +826,37 @@ class ContractBridge:
             logger.error(f"Failed to get score history: {e}")
             raise
     
+    async def get_credit_score_with_history(self, user_address: str) -> Tuple[CreditScore, List[int]]:
+        """Get credit score and score history for a user in a single Multicall3 eth_call"""
+        try:
+            # Validate user address
+            if not is_address(user_address):
+                raise ValueError(f"Invalid user address: {user_address}")
+            
+            user_address = _checksum(user_address)
+            
+            # Batch both view calls - allowFailure=False reverts the whole call on error
+            user_calldata = encode(['address'], [user_address])
+            calls = [
+                (self.registry_address, False, _SELECTORS['getCreditScore'] + user_calldata),
+                (self.registry_address, False, _SELECTORS['getScoreHistory'] + user_calldata)
+            ]
+            (_, score_return), (_, history_return) = self.multicall_contract.functions.aggregate3(calls).call()
+            
+            # Decode each return per its output types
+            (score_data,) = decode([CREDIT_SCORE_ABI_TYPE], score_return)
+            (history,) = decode(['uint256[]'], history_return)
+            
+            credit_score = CreditScore(*score_data)
+            
+            logger.info(f"Retrieved credit score and history for {user_address}: "
+                        f"{credit_score.totalScore} ({len(history)} entries)")
+            return credit_score, list(history)
+            
+        except Exception as e:
+            logger.error(f"Failed to get credit score with history: {e}")
+            raise
+    
     async def full_score_calculation_flow(self, user_address: str, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Complete flow: Update behavioral data and calculate credit score"""
         try:
@@ -581,8 +886,17 @@ class ContractBridge:
             # Wait for calculation to complete
             await asyncio.sleep(5)
             
-            # Step 3: Retrieve calculated score
-            credit_score = await self.get_credit_score(user_address)
+            # Step 3: Retrieve calculated score and its history in one Multicall3 eth_call
+            try:
+                credit_score, score_history = await self.get_credit_score_with_history(user_address)
+            except Exception as e:
+                # Both transactions are already mined - on chains without Multicall3 read the score directly
+                logger.warning(f"Multicall3 read failed, reading score and history separately: {e}")
+                credit_score = await self.get_credit_score(user_address)
+                try:
+                    score_history = await self.get_score_history(user_address)
+                except Exception:
+                    score_history = None
             
             result = {
                 'success': True,
@@ -599,6 +913,7 @@ class ContractBridge:
                     'updateCount': credit_score.updateCount,
                     'isActive': credit_score.isActive
                 },
+                'score_history': score_history,
                 'transactions': {
                     'update_tx': update_tx,
                     'calculate_tx': calc_tx
@@ -627,15 +942,31 @@ class ContractBridge:
     def get_contract_info(self) -> Dict[str, Any]:
         """Get contract information for debugging"""
         try:
-            protocol_version = self.registry_contract.functions.PROTOCOL_VERSION().call()
-            owner = self.registry_contract.functions.owner().call()
-            is_authorized = self.registry_contract.functions.authorizedDataProviders(self.account.address).call()
+            # Constant data - fetched once per contract
+            static_key = (self.chain_id, self.registry_address)
+            static_info = _static_contract_info.get(static_key)
+            if static_info is None:
+                static_info = {
+                    'protocol_version': self.registry_contract.functions.PROTOCOL_VERSION().call(),
+                    'owner': self.registry_contract.functions.owner().call()
+                }
+                _static_contract_info[static_key] = static_info
+            
+            # Rarely-changing data - refreshed after the TTL expires
+            auth_key = (self.chain_id, self.registry_address, self.account.address)
+            cached_auth = _authorization_cache.get(auth_key)
+            now = time.monotonic()
+            if cached_auth is None or now - cached_auth[0] > AUTHORIZATION_CACHE_TTL:
+                is_authorized = self.registry_contract.functions.authorizedDataProviders(self.account.address).call()
+                _authorization_cache[auth_key] = (now, is_authorized)
+            else:
+                is_authorized = cached_auth[1]
             
             return {
                 'success': True,
                 'contract_address': self.registry_address,
-                'protocol_version': protocol_version,
-                'owner': owner,
+                'protocol_version': static_info['protocol_version'],
+                'owner': static_info['owner'],
                 'data_provider_authorized': is_authorized,
                 'account_address': self.account.address,
                 'chain_id': self.chain_id,
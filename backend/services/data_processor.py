@@ -5,28 +5,288 @@ import sys
 import os
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timedelta
-import json
+import time
+import numpy as np
+from dataclasses import dataclass
+from operator import attrgetter
+from functools import lru_cache
+from collections import OrderedDict
+from types import MappingProxyType
 from loguru import logger
 
 # Fix the import path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
-import asyncio
-import sys
-import os
-from typing import Dict, List, Any, Tuple, Optional
-from datetime import datetime, timedelta
-import json
-from loguru import logger
+from clients.multi_chain_aggregator import MultiChainDataAggregator
+from services.scoring_kernels import compute_tx_scores, compute_defi_scores, compute_staking_scores
 
-# Fix import path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+# ciso8601 is optional - without it ISO timestamps go through datetime.fromisoformat
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    def _parse_iso_datetime(value: str) -> datetime:
+        if isinstance(value, str) and value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
 
-from clients.multi_chain_aggregator import MultiChainDataAggregator
+# fastjsonschema is optional - without it validate_contract_format only runs the per-field checks
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Raw aggregator data per address is reused for this many seconds
+# LRU-bounded since every cached address pins a full multi-source payload
+RAW_DATA_CACHE_TTL = 60
+RAW_DATA_CACHE_SIZE = 256
+_raw_data_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Aggregator handed out by _get_aggregator, created on first use
+_shared_aggregator: Optional[MultiChainDataAggregator] = None
+
+# Upper bound for any single uint256 value sent to the contract
+_CONTRACT_VALUE_CAP = 1_000_000_000
+
+# Contract-ready fields taken from each metric bundle (uint256), in contract order
+_TX_CONTRACT_FIELDS = (
+    'transactionFrequency', 'averageTransactionValue', 'gasEfficiencyScore',
+    'crossChainActivityCount', 'consistencyMetric'
+)
+_DEFI_CONTRACT_FIELDS = (
+    'protocolInteractionCount', 'totalDeFiBalanceUSD', 'liquidityPositionCount',
+    'protocolDiversityScore', 'interactionDepthScore', 'yieldFarmingActive'
+)
+_STAKING_CONTRACT_FIELDS = (
+    'totalStakedUSD', 'stakingDurationDays', 'stakingPlatformCount',
+    'rewardClaimFrequency', 'stakingLoyaltyScore', 'platformDiversityScore'
+)
+_RISK_CONTRACT_FIELDS = ('liquidationEventCount', 'leverageRatio', 'portfolioVolatility')
+_HISTORY_CONTRACT_FIELDS = ('accountAgeScore', 'activityConsistencyScore', 'engagementScore')
+
+_CONTRACT_FIELDS = (
+    _TX_CONTRACT_FIELDS + _DEFI_CONTRACT_FIELDS + _STAKING_CONTRACT_FIELDS
+    + _RISK_CONTRACT_FIELDS + _HISTORY_CONTRACT_FIELDS
+)
+
+_get_tx_contract_fields = attrgetter(*_TX_CONTRACT_FIELDS)
+_get_defi_contract_fields = attrgetter(*_DEFI_CONTRACT_FIELDS)
+_get_staking_contract_fields = attrgetter(*_STAKING_CONTRACT_FIELDS)
+_get_risk_contract_fields = attrgetter(*_RISK_CONTRACT_FIELDS)
+_get_history_contract_fields = attrgetter(*_HISTORY_CONTRACT_FIELDS)
+
+# Fields that must be present in contract-ready metrics
+_REQUIRED_FIELDS = frozenset({
+    'transactionFrequency', 'averageTransactionValue', 'gasEfficiencyScore',
+    'protocolInteractionCount', 'totalDeFiBalanceUSD', 'totalStakedUSD',
+    'liquidationEventCount', 'leverageRatio', 'portfolioVolatility'
+})
+
+# Contract metrics schema: required fields present, every value a non-negative integer
+_CONTRACT_SCHEMA = {
+    'type': 'object',
+    'required': sorted(_REQUIRED_FIELDS),
+    'additionalProperties': {'type': 'integer', 'minimum': 0}
+}
+_validate_contract_schema = fastjsonschema.compile(_CONTRACT_SCHEMA) if fastjsonschema else None
+
+# Safe contract metrics returned when processing fails
+_FALLBACK_METRICS: Dict[str, int] = {
+    # Transaction metrics
+    'transactionFrequency': 0,
+    'averageTransactionValue': 0,
+    'gasEfficiencyScore': 50,
+    'crossChainActivityCount': 0,
+    'consistencyMetric': 0,
+    
+    # DeFi metrics
+    'protocolInteractionCount': 0,
+    'totalDeFiBalanceUSD': 0,
+    'liquidityPositionCount': 0,
+    'protocolDiversityScore': 0,
+    'interactionDepthScore': 0,
+    'yieldFarmingActive': 0,
+    
+    # Staking metrics
+    'totalStakedUSD': 0,
+    'stakingDurationDays': 0,
+    'stakingPlatformCount': 0,
+    'rewardClaimFrequency': 0,
+    'stakingLoyaltyScore': 0,
+    'platformDiversityScore': 0,
+    
+    # Risk metrics
+    'liquidationEventCount': 0,
+    'leverageRatio': 100,
+    'portfolioVolatility': 50,
+    
+    # History metrics
+    'accountAgeScore': 0,
+    'activityConsistencyScore': 0,
+    'engagementScore': 0
+}
+
+# Recommendation messages, indexed by bit position in _generate_recommendations
+_RECOMMENDATIONS = (
+    # Data quality recommendations
+    "Consider improving data collection completeness",
+    "Multiple data sources recommended for better accuracy",
+    # Behavioral recommendations
+    "Low transaction activity may affect score accuracy",
+    "DeFi interaction data missing - consider protocol engagement",
+    "No staking activity detected - consider staking for credit building"
+)
+
+# Defaults for BehavioralMetrics fields missing from contract metrics
+_BEHAVIORAL_METRICS_DEFAULTS = MappingProxyType({
+    'transactionFrequency': 0,
+    'averageTransactionValue': 0,
+    'gasEfficiencyScore': 50,
+    'crossChainActivityCount': 0,
+    'consistencyMetric': 0,
+    'protocolInteractionCount': 0,
+    'totalDeFiBalanceUSD': 0,
+    'liquidityPositionCount': 0,
+    'protocolDiversityScore': 0,
+    'interactionDepthScore': 0,
+    'yieldFarmingActive': 0,
+    'totalStakedUSD': 0,
+    'stakingDurationDays': 0,
+    'stakingPlatformCount': 0,
+    'rewardClaimFrequency': 0,
+    'stakingLoyaltyScore': 0,
+    'platformDiversityScore': 0,
+    'liquidationEventCount': 0,
+    'leverageRatio': 100,
+    'portfolioVolatility': 50,
+    'riskScore': 50,
+    'accountAge': 0,
+    'lastActivityDays': 0,
+    'engagementScore': 50
+})
+
+# Portfolio volatility estimates per user category
+_VOLATILITY_MAP = {
+    'whale_power_user': 15,
+    'advanced_defi_user': 25,
+    'active_defi_user': 30,
+    'staking_focused_user': 20,
+    'active_crypto_user': 35,
+    'casual_user': 40,
+    'newcomer': 50
+}
+
+# Risk scores per user category
+_RISK_SCORES = {
+    'whale_power_user': 90,
+    'advanced_defi_user': 75,
+    'active_defi_user': 65,
+    'staking_focused_user': 80,
+    'active_crypto_user': 60,
+    'casual_user': 50,
+    'newcomer': 40
+}
+
+@lru_cache(maxsize=16)
+def _portfolio_volatility(user_category: str) -> int:
+    """Volatility estimate for a user category"""
+    return _VOLATILITY_MAP.get(user_category, 40)
+
+@lru_cache(maxsize=16)
+def _risk_score(user_category: str) -> int:
+    """Risk score for a user category"""
+    return _RISK_SCORES.get(user_category, 40)
+
+def _collection_stats(collection_status: Dict) -> Tuple[int, int, float]:
+    """(successful sources, total sources, total collection time) in one pass over the statuses"""
+    successful_sources = 0
+    total_collection_time = 0
+    for status in collection_status.values():
+        if status.get('success'):
+            successful_sources += 1
+        total_collection_time += status.get('collection_time', 0)
+    return successful_sources, len(collection_status), total_collection_time
+
+def _get_aggregator() -> MultiChainDataAggregator:
+    """Aggregator (and its API clients) shared by all processor instances, created on first use"""
+    global _shared_aggregator
+    if _shared_aggregator is None:
+        _shared_aggregator = MultiChainDataAggregator()
+    return _shared_aggregator
+
+def _clip100(value):
+    """Clamp a score to the 0-100 range"""
+    return 0 if value < 0 else (100 if value > 100 else value)
+
+@dataclass(slots=True, frozen=True)
+class TransactionMetrics:
+    """Processed transaction metrics (Alchemy)"""
+    transactionFrequency: int
+    averageTransactionValue: int
+    gasEfficiencyScore: int
+    crossChainActivityCount: int
+    consistencyMetric: int
+    totalTransactionCount: int
+    rawMonthlyCount: int
+    dataSource: str
+    dataQuality: int
+
+@dataclass(slots=True, frozen=True)
+class DefiMetrics:
+    """Processed DeFi metrics (Zapper)"""
+    protocolInteractionCount: int
+    totalDeFiBalanceUSD: int
+    liquidityPositionCount: int
+    protocolDiversityScore: int
+    interactionDepthScore: int
+    yieldFarmingActive: int
+    protocolInteractionScore: int
+    dataSource: str
+    dataQuality: int
+
+@dataclass(slots=True, frozen=True)
+class StakingMetrics:
+    """Processed staking metrics (Moralis)"""
+    totalStakedUSD: int
+    stakingDurationDays: int
+    stakingPlatformCount: int
+    rewardClaimFrequency: int
+    stakingLoyaltyScore: int
+    platformDiversityScore: int
+    stakingSophisticationScore: int
+    dataSource: str
+    dataQuality: int
+
+@dataclass(slots=True, frozen=True)
+class RiskMetrics:
+    """Processed risk metrics"""
+    liquidationEventCount: int
+    leverageRatio: int
+    portfolioVolatility: int
+    riskCategoryScore: int
+    volatilityScore: int
+    portfolioValueUSD: int
+    userCategory: str
+
+@dataclass(slots=True, frozen=True)
+class HistoryMetrics:
+    """Processed historical behavior metrics"""
+    accountAgeScore: int
+    activityConsistencyScore: int
+    engagementScore: int
+    overallQualityScore: int
+    dataCompletenessScore: int
+
+@dataclass(slots=True, frozen=True)
+class MetaMetrics:
+    """Meta-metrics about the data collection process"""
+    successfulSources: int
+    totalSources: int
+    successRate: int
+    totalCollectionTime: int
+    averageCollectionTime: int
 
 class DataProcessor:
     """
@@ -34,25 +294,25 @@ class DataProcessor:
     Transforms comprehensive data into exact integer format required by protocol
     """
     
+    # Data quality thresholds
+    quality_thresholds = MappingProxyType({
+        'min_transactions': 5,
+        'min_chains': 1,
+        'min_data_points': 3,
+        'staleness_hours': 24
+    })
+    
+    # Processing configuration
+    processing_config = MappingProxyType({
+        'max_usd_value_cap': 10_000_000,  # Cap extreme values
+        'min_percentage_threshold': 1,    # Minimum percentage for calculations
+        'default_gas_efficiency': 50,     # Default gas efficiency score
+        'consistency_weight': 0.6,        # Weight for consistency calculations
+        'volatility_smoothing': 0.8       # Smoothing factor for volatility
+    })
+    
     def __init__(self):
-        self.aggregator = MultiChainDataAggregator()
-        
-        # Data quality thresholds
-        self.quality_thresholds = {
-            'min_transactions': 5,
-            'min_chains': 1,
-            'min_data_points': 3,
-            'staleness_hours': 24
-        }
-        
-        # Processing configuration
-        self.processing_config = {
-            'max_usd_value_cap': 10_000_000,  # Cap extreme values
-            'min_percentage_threshold': 1,    # Minimum percentage for calculations
-            'default_gas_efficiency': 50,     # Default gas efficiency score
-            'consistency_weight': 0.6,        # Weight for consistency calculations
-            'volatility_smoothing': 0.8       # Smoothing factor for volatility
-        }
+        self.aggregator = _get_aggregator()
     
     async def process_user_behavioral_data(self, address: str) -> Tuple[Dict[str, int], Dict[str, Any]]:
         """
@@ -66,16 +326,62 @@ class DataProcessor:
         
         try:
             # Step 1: Collect comprehensive raw data
-            raw_data = await self.aggregator.fetch_user_comprehensive_data(address)
+            raw_data = await self._fetch_raw_data(address)
+            
+        except Exception as e:
+            logger.error(f"Error processing behavioral data for {address}: {str(e)}")
+            return self._get_error_result(e)
+        
+        return self._process_raw_data(address, raw_data)
+    
+    async def process_batch(self, addresses: List[str]) -> List[Tuple[Dict[str, int], Dict[str, Any]]]:
+        """Process several addresses, collecting upstream data for the whole batch at once"""
+        
+        try:
+            raw_by_address = await self._fetch_many(addresses)
+            
+        except Exception as e:
+            logger.error(f"Error collecting batch data for {len(addresses)} addresses: {str(e)}")
+            return [self._get_error_result(e) for _ in addresses]
+        
+        raw_list = [raw_by_address[a.lower()] for a in addresses]
+        
+        # Scoring and packaging are pure CPU work (and the first kernel call JIT-compiles) - keep them off the event loop
+        return await asyncio.to_thread(self._score_batch, addresses, raw_list, time.time())
+    
+    def _score_batch(self, addresses: List[str], raw_list: List[Dict],
+                     now: float) -> List[Tuple[Dict[str, int], Dict[str, Any]]]:
+        """Score already-collected raw data for a batch of addresses"""
+        
+        # Score the per-source metrics for the whole batch in one kernel call each
+        try:
+            source_metrics = self._process_source_metrics_batch(raw_list)
+        except Exception as e:
+            logger.warning(f"Batch scoring failed, falling back to per-address scoring: {str(e)}")
+            source_metrics = [None] * len(raw_list)
+        
+        return [
+            self._process_raw_data(address, raw_data, sources, now)
+            for address, raw_data, sources in zip(addresses, raw_list, source_metrics)
+        ]
+    
+    def _process_raw_data(self, address: str, raw_data: Dict,
+                          source_metrics: Optional[Tuple[TransactionMetrics, DefiMetrics, StakingMetrics]] = None,
+                          now: Optional[float] = None) -> Tuple[Dict[str, int], Dict[str, Any]]:
+        """Run validation, extraction and formatting on already-collected raw data"""
+        
+        try:
+            # Source success/timing counters shared by validation and meta metrics
+            collection_stats = _collection_stats(raw_data.get('collection_status', {}))
             
             # Step 2: Validate data quality
-            data_quality = self._validate_data_quality(raw_data)
+            data_quality = self._validate_data_quality(raw_data, now, collection_stats)
             
             if not data_quality['is_valid']:
                 logger.warning(f"Data quality issues for {address}: {data_quality['issues']}")
             
             # Step 3: Extract and process behavioral metrics
-            behavioral_metrics = self._extract_behavioral_metrics(raw_data)
+            behavioral_metrics = self._extract_behavioral_metrics(raw_data, source_metrics, collection_stats)
             
             # Step 4: Apply smart contract formatting
             contract_metrics = self._format_for_smart_contract(behavioral_metrics)
@@ -86,34 +392,107 @@ class DataProcessor:
             )
             
             logger.info(f"Successfully processed behavioral data for {address}")
-            logger.info(f"Contract metrics preview: Total Score Components = {sum(contract_metrics.values())}")
+            logger.opt(lazy=True).info(
+                "Contract metrics preview: Total Score Components = {}",
+                lambda: sum(contract_metrics.values())
+            )
             
             return contract_metrics, processing_metadata
             
         except Exception as e:
             logger.error(f"Error processing behavioral data for {address}: {str(e)}")
+            return self._get_error_result(e)
+    
+    def _get_error_result(self, error: Exception) -> Tuple[Dict[str, int], Dict[str, Any]]:
+        """Return fallback metrics with error information"""
+        
+        error_metadata = {
+            'processing_status': 'failed',
+            'error': str(error),
+            'timestamp': datetime.now().isoformat(),
+            'fallback_used': True
+        }
+        
+        return self._get_fallback_metrics(), error_metadata
+    
+    async def _fetch_raw_data(self, address: str) -> Dict[str, Any]:
+        """Fetch comprehensive raw data, reusing results younger than RAW_DATA_CACHE_TTL"""
+        
+        key = address.lower()
+        
+        cached = self._get_cached_raw_data(key)
+        if cached is not None:
+            logger.info(f"Using cached raw data for {address}")
+            return cached
+        
+        raw_data = await self.aggregator.fetch_user_comprehensive_data(address)
+        self._cache_raw_data(key, raw_data)
+        
+        return raw_data
+    
+    async def _fetch_many(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch raw data for many addresses, keyed by lowercase address"""
+        
+        raw_by_address = {}
+        missing = []
+        
+        for address in dict.fromkeys(a.lower() for a in addresses):
+            cached = self._get_cached_raw_data(address)
+            if cached is not None:
+                raw_by_address[address] = cached
+            else:
+                missing.append(address)
+        
+        if missing:
+            fetched = await self.aggregator.fetch_batch_raw(missing)
             
-            # Return fallback metrics with error information
-            fallback_metrics = self._get_fallback_metrics()
-            error_metadata = {
-                'processing_status': 'failed',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat(),
-                'fallback_used': True
-            }
-            
-            return fallback_metrics, error_metadata
+            for address, raw_data in fetched.items():
+                self._cache_raw_data(address, raw_data)
+            raw_by_address.update(fetched)
+        
+        return raw_by_address
     
-    def _validate_data_quality(self, raw_data: Dict) -> Dict[str, Any]:
-        """Validate the quality of collected data"""
+    def _get_cached_raw_data(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached raw data if it is still fresh"""
+        
+        cached = _raw_data_cache.get(key)
+        if cached is None:
+            return None
+        
+        if time.monotonic() - cached[0] >= RAW_DATA_CACHE_TTL:
+            del _raw_data_cache[key]
+            return None
+        
+        _raw_data_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_raw_data(self, key: str, raw_data: Dict[str, Any]):
+        """Store raw data in the TTL cache unless every source failed"""
+        
+        # Don't pin a failed collection in the cache
+        if any(s.get('success') for s in raw_data.get('collection_status', {}).values()):
+            _raw_data_cache[key] = (time.monotonic(), raw_data)
+            _raw_data_cache.move_to_end(key)
+            if len(_raw_data_cache) > RAW_DATA_CACHE_SIZE:
+                _raw_data_cache.popitem(last=False)
+    
+    def _validate_data_quality(self, raw_data: Dict, now: Optional[float] = None,
+                               collection_stats: Optional[Tuple[int, int, float]] = None) -> Dict[str, Any]:
+        """
+        Validate the quality of collected data
+        
+        Args:
+            now: Epoch seconds to measure data age against - pass a shared value when validating a batch
+            collection_stats: Precomputed _collection_stats() result, computed here if omitted
+        """
         
         issues = []
         quality_score = 0
         
         # Check collection status
-        collection_status = raw_data.get('collection_status', {})
-        successful_sources = sum(1 for status in collection_status.values() 
-                               if status.get('success', False))
+        if collection_stats is None:
+            collection_stats = _collection_stats(raw_data.get('collection_status', {}))
+        successful_sources = collection_stats[0]
         
         if successful_sources == 0:
             issues.append("No successful data sources")
@@ -124,14 +503,16 @@ class DataProcessor:
         collection_time = raw_data.get('collection_timestamp')
         if collection_time:
             try:
-                collection_dt = datetime.fromisoformat(collection_time)
-                age_hours = (datetime.now() - collection_dt).total_seconds() / 3600
+                # The aggregator emits epoch seconds; ISO strings are still accepted
+                if not isinstance(collection_time, (int, float)):
+                    collection_time = _parse_iso_datetime(collection_time).timestamp()
+                age_hours = ((now if now is not None else time.time()) - collection_time) / 3600
                 
                 if age_hours > self.quality_thresholds['staleness_hours']:
                     issues.append(f"Data is {age_hours:.1f} hours old")
                 else:
                     quality_score += 25  # Freshness bonus
-            except Exception:
+            except (ValueError, TypeError):
                 issues.append("Invalid collection timestamp")
         
         # Check data completeness
@@ -152,7 +533,10 @@ class DataProcessor:
             'recommendation': 'proceed' if quality_score >= 50 else 'retry_collection'
         }
     
-    def _extract_behavioral_metrics(self, raw_data: Dict) -> Dict[str, Any]:
+    def _extract_behavioral_metrics(self, raw_data: Dict,
+                                    source_metrics: Optional[Tuple[TransactionMetrics, DefiMetrics, StakingMetrics]] = None,
+                                    collection_stats: Optional[Tuple[int, int, float]] = None
+                                    ) -> Dict[str, Any]:
         """Extract and compute behavioral metrics from raw data"""
         
         # Extract data sections safely
@@ -160,23 +544,27 @@ class DataProcessor:
         user_analytics = raw_data.get('user_analytics', {})
         collection_status = raw_data.get('collection_status', {})
         
-        # Process transaction data
-        transaction_data = self._process_transaction_data(
-            structured_metrics.get('transaction_metrics', {}),
-            collection_status.get('alchemy', {})
-        )
-        
-        # Process DeFi data
-        defi_data = self._process_defi_data(
-            structured_metrics.get('defi_metrics', {}),
-            collection_status.get('zapper', {})
-        )
-        
-        # Process staking data
-        staking_data = self._process_staking_data(
-            structured_metrics.get('staking_metrics', {}),
-            collection_status.get('moralis', {})
-        )
+        if source_metrics is not None:
+            # Already scored by the batch kernels
+            transaction_data, defi_data, staking_data = source_metrics
+        else:
+            # Process transaction data
+            transaction_data = self._process_transaction_data(
+                structured_metrics.get('transaction_metrics', {}),
+                collection_status.get('alchemy', {})
+            )
+            
+            # Process DeFi data
+            defi_data = self._process_defi_data(
+                structured_metrics.get('defi_metrics', {}),
+                collection_status.get('zapper', {})
+            )
+            
+            # Process staking data
+            staking_data = self._process_staking_data(
+                structured_metrics.get('staking_metrics', {}),
+                collection_status.get('moralis', {})
+            )
         
         # Process risk metrics
         risk_data = self._process_risk_data(raw_data, user_analytics)
@@ -190,47 +578,119 @@ class DataProcessor:
             'staking_metrics': staking_data,
             'risk_metrics': risk_data,
             'history_metrics': history_data,
-            'meta_metrics': self._calculate_meta_metrics(raw_data)
+            'meta_metrics': self._calculate_meta_metrics(raw_data, collection_stats)
         }
     
-    def _process_transaction_data(self, tx_data: Dict, status_data: Dict) -> Dict[str, Any]:
+    def _process_source_metrics_batch(self, raw_list: List[Dict]
+                                      ) -> List[Tuple[TransactionMetrics, DefiMetrics, StakingMetrics]]:
+        """Score transaction, DeFi and staking metrics for a batch of users with the vectorized kernels"""
+        
+        cap = float(self.processing_config['max_usd_value_cap'])
+        default_gas = self.processing_config['default_gas_efficiency']
+        
+        structured = [raw_data.get('structured_metrics', {}) for raw_data in raw_list]
+        tx_inputs = [m.get('transaction_metrics', {}) for m in structured]
+        defi_inputs = [m.get('defi_metrics', {}) for m in structured]
+        staking_inputs = [m.get('staking_metrics', {}) for m in structured]
+        
+        def column(inputs, key, default=0):
+            # Anything non-numeric (e.g. None) sends the batch back to per-address scoring,
+            # which handles those values its own way
+            values = [d.get(key, default) for d in inputs]
+            if not all(isinstance(value, (int, float)) for value in values):
+                raise TypeError(f"Non-numeric '{key}' value in batch input")
+            # The kernels' int64 casts wrap on NaN/inf and on magnitudes of 2**63 and above
+            staged = np.array(values, dtype=np.float64)
+            if not (np.abs(staged) < 2.0 ** 63).all():
+                raise ValueError(f"Out-of-range '{key}' value in batch input")
+            return staged
+        
+        # Stage inputs column-wise and run one kernel per source
+        tx_rows = compute_tx_scores(
+            column(tx_inputs, 'monthly_txn_count'), column(tx_inputs, 'avg_value_usd'),
+            column(tx_inputs, 'gas_efficiency', default_gas), column(tx_inputs, 'active_chains'),
+            column(tx_inputs, 'consistency_score'), cap
+        ).tolist()
+        defi_rows = compute_defi_scores(
+            column(defi_inputs, 'unique_protocols'), column(defi_inputs, 'total_balance_usd'),
+            column(defi_inputs, 'lp_positions'), column(defi_inputs, 'diversity_score'),
+            column(defi_inputs, 'interaction_depth_score'), column(defi_inputs, 'yield_farming_active'), cap
+        ).tolist()
+        staking_rows = compute_staking_scores(
+            column(staking_inputs, 'total_staked_usd'), column(staking_inputs, 'avg_duration_days'),
+            column(staking_inputs, 'platform_count'), column(staking_inputs, 'claim_frequency'),
+            column(staking_inputs, 'staking_loyalty_score'), cap
+        ).tolist()
+        
+        # Package rows back into per-user metric bundles
+        results = []
+        for raw_data, tx_data, staking_data, tx_row, defi_row, staking_row in zip(
+                raw_list, tx_inputs, staking_inputs, tx_rows, defi_rows, staking_rows):
+            collection_status = raw_data.get('collection_status', {})
+            results.append((
+                TransactionMetrics(
+                    *tx_row,
+                    totalTransactionCount=tx_data.get('total_transactions', 0),
+                    rawMonthlyCount=tx_data.get('monthly_txn_count', 0),
+                    dataSource='alchemy',
+                    dataQuality=100 if collection_status.get('alchemy', {}).get('success') else 25
+                ),
+                DefiMetrics(
+                    *defi_row,
+                    dataSource='zapper',
+                    dataQuality=100 if collection_status.get('zapper', {}).get('success') else 25
+                ),
+                StakingMetrics(
+                    *staking_row,
+                    stakingSophisticationScore=int(staking_data.get('sophistication_score', 0)),
+                    dataSource='moralis',
+                    dataQuality=100 if collection_status.get('moralis', {}).get('success') else 25
+                )
+            ))
+        
+        return results
+    
+    def _process_transaction_data(self, tx_data: Dict, status_data: Dict) -> TransactionMetrics:
         """Process transaction-related metrics"""
         
+        config = self.processing_config
+        
         # Safe extraction with defaults
         monthly_txns = tx_data.get('monthly_txn_count', 0)
         avg_value = float(tx_data.get('avg_value_usd', 0) or 0)
-        gas_efficiency = tx_data.get('gas_efficiency', self.processing_config['default_gas_efficiency'])
+        gas_efficiency = tx_data.get('gas_efficiency', config['default_gas_efficiency'])
         active_chains = tx_data.get('active_chains', 0)
         consistency = tx_data.get('consistency_score', 0)
         total_transactions = tx_data.get('total_transactions', 0)
         
         # Apply processing logic
-        processed_avg_value = min(avg_value, self.processing_config['max_usd_value_cap'])
+        processed_avg_value = min(avg_value, config['max_usd_value_cap'])
         
         # Calculate frequency score (0-100 scale)
-        frequency_score = min(100, monthly_txns * 2)  # 2 points per monthly transaction
+        frequency_score = monthly_txns * 2  # 2 points per monthly transaction
+        if frequency_score > 100:
+            frequency_score = 100
         
         # Normalize consistency (0-100 scale)
-        consistency_normalized = max(0, min(100, consistency))
-        
-        # Cross-chain activity score
-        cross_chain_score = min(100, active_chains * 25)  # 25 points per chain
-        
-        return {
-            'transactionFrequency': frequency_score,
-            'averageTransactionValue': int(processed_avg_value),
-            'gasEfficiencyScore': int(gas_efficiency),
-            'crossChainActivityCount': active_chains,
-            'consistencyMetric': int(consistency_normalized),
-            'totalTransactionCount': total_transactions,
-            'rawMonthlyCount': monthly_txns,
-            'dataSource': 'alchemy',
-            'dataQuality': 100 if status_data.get('success') else 25
-        }
+        consistency_normalized = _clip100(consistency)
+        
+        return TransactionMetrics(
+            transactionFrequency=frequency_score,
+            averageTransactionValue=int(processed_avg_value),
+            gasEfficiencyScore=int(gas_efficiency),
+            crossChainActivityCount=active_chains,
+            consistencyMetric=int(consistency_normalized),
+            totalTransactionCount=total_transactions,
+            rawMonthlyCount=monthly_txns,
+            dataSource='alchemy',
+            dataQuality=100 if status_data.get('success') else 25
+        )
     
-    def _process_defi_data(self, defi_data: Dict, status_data: Dict) -> Dict[str, Any]:
+    def _process_defi_data(self, defi_data: Dict, status_data: Dict) -> DefiMetrics:
         """Process DeFi-related metrics"""
         
+        config = self.processing_config
+        
         # Safe extraction
         unique_protocols = defi_data.get('unique_protocols', 0)
         total_balance = float(defi_data.get('total_balance_usd', 0) or 0)
@@ -240,29 +700,32 @@ class DataProcessor:
         yield_farming = defi_data.get('yield_farming_active', 0)
         
         # Process values
-        capped_balance = min(total_balance, self.processing_config['max_usd_value_cap'])
+        capped_balance = min(total_balance, config['max_usd_value_cap'])
         
         # Calculate derived metrics
-        protocol_interaction_score = min(100, unique_protocols * 10)  # 10 points per protocol
-        liquidity_score = min(100, lp_positions * 20)  # 20 points per LP position
-        diversity_normalized = max(0, min(100, diversity_score))
-        interaction_depth_normalized = max(0, min(100, interaction_depth))
-        
-        return {
-            'protocolInteractionCount': unique_protocols,
-            'totalDeFiBalanceUSD': int(capped_balance),
-            'liquidityPositionCount': lp_positions,
-            'protocolDiversityScore': int(diversity_normalized),
-            'interactionDepthScore': int(interaction_depth_normalized),
-            'yieldFarmingActive': int(bool(yield_farming)),
-            'protocolInteractionScore': protocol_interaction_score,
-            'dataSource': 'zapper',
-            'dataQuality': 100 if status_data.get('success') else 25
-        }
+        protocol_interaction_score = unique_protocols * 10  # 10 points per protocol
+        if protocol_interaction_score > 100:
+            protocol_interaction_score = 100
+        diversity_normalized = _clip100(diversity_score)
+        interaction_depth_normalized = _clip100(interaction_depth)
+        
+        return DefiMetrics(
+            protocolInteractionCount=unique_protocols,
+            totalDeFiBalanceUSD=int(capped_balance),
+            liquidityPositionCount=lp_positions,
+            protocolDiversityScore=int(diversity_normalized),
+            interactionDepthScore=int(interaction_depth_normalized),
+            yieldFarmingActive=int(bool(yield_farming)),
+            protocolInteractionScore=protocol_interaction_score,
+            dataSource='zapper',
+            dataQuality=100 if status_data.get('success') else 25
+        )
     
-    def _process_staking_data(self, staking_data: Dict, status_data: Dict) -> Dict[str, Any]:
+    def _process_staking_data(self, staking_data: Dict, status_data: Dict) -> StakingMetrics:
         """Process staking-related metrics"""
         
+        config = self.processing_config
+        
         # Safe extraction
         total_staked = float(staking_data.get('total_staked_usd', 0) or 0)
         duration_days = staking_data.get('avg_duration_days', 0)
@@ -272,26 +735,26 @@ class DataProcessor:
         sophistication = staking_data.get('sophistication_score', 0)
         
         # Process values
-        capped_staked = min(total_staked, self.processing_config['max_usd_value_cap'])
+        capped_staked = min(total_staked, config['max_usd_value_cap'])
         
         # Calculate derived metrics
-        duration_score = min(100, duration_days / 3.65)  # Normalize to 100 (365 days = 100)
-        platform_diversity = min(100, platform_count * 20)  # 20 points per platform
-        reward_claim_score = min(100, claim_frequency * 5)  # 5 points per claim
-        
-        return {
-            'totalStakedUSD': int(capped_staked),
-            'stakingDurationDays': int(duration_days),
-            'stakingPlatformCount': platform_count,
-            'rewardClaimFrequency': claim_frequency,
-            'stakingLoyaltyScore': int(loyalty_score),
-            'platformDiversityScore': platform_diversity,
-            'stakingSophisticationScore': int(sophistication),
-            'dataSource': 'moralis',
-            'dataQuality': 100 if status_data.get('success') else 25
-        }
+        platform_diversity = platform_count * 20  # 20 points per platform
+        if platform_diversity > 100:
+            platform_diversity = 100
+        
+        return StakingMetrics(
+            totalStakedUSD=int(capped_staked),
+            stakingDurationDays=int(duration_days),
+            stakingPlatformCount=platform_count,
+            rewardClaimFrequency=claim_frequency,
+            stakingLoyaltyScore=int(loyalty_score),
+            platformDiversityScore=platform_diversity,
+            stakingSophisticationScore=int(sophistication),
+            dataSource='moralis',
+            dataQuality=100 if status_data.get('success') else 25
+        )
     
-    def _process_risk_data(self, raw_data: Dict, user_analytics: Dict) -> Dict[str, Any]:
+    def _process_risk_data(self, raw_data: Dict, user_analytics: Dict) -> RiskMetrics:
         """Process risk-related metrics"""
         
         # Extract risk indicators
@@ -305,19 +768,21 @@ class DataProcessor:
         
         # Risk scoring
         risk_category_score = self._get_risk_category_score(user_category)
-        volatility_score = max(0, 100 - portfolio_volatility * 2)  # Lower volatility = higher score
-        
-        return {
-            'liquidationEventCount': liquidation_events,
-            'leverageRatio': leverage_ratio,
-            'portfolioVolatility': int(portfolio_volatility),
-            'riskCategoryScore': risk_category_score,
-            'volatilityScore': int(volatility_score),
-            'portfolioValueUSD': int(min(portfolio_value, self.processing_config['max_usd_value_cap'])),
-            'userCategory': user_category
-        }
+        volatility_score = 100 - portfolio_volatility * 2  # Lower volatility = higher score
+        if volatility_score < 0:
+            volatility_score = 0
+        
+        return RiskMetrics(
+            liquidationEventCount=liquidation_events,
+            leverageRatio=leverage_ratio,
+            portfolioVolatility=int(portfolio_volatility),
+            riskCategoryScore=risk_category_score,
+            volatilityScore=int(volatility_score),
+            portfolioValueUSD=int(min(portfolio_value, self.processing_config['max_usd_value_cap'])),
+            userCategory=user_category
+        )
     
-    def _process_history_data(self, raw_data: Dict, user_analytics: Dict) -> Dict[str, Any]:
+    def _process_history_data(self, raw_data: Dict, user_analytics: Dict) -> HistoryMetrics:
         """Process historical behavior patterns"""
         
         # Extract historical data
@@ -328,15 +793,17 @@ class DataProcessor:
         # Calculate history metrics
         account_age_score = 50  # Placeholder - would calculate from first transaction
         activity_consistency = overall_quality  # Use data quality as proxy for consistency
-        engagement_score = min(100, activity_score)
-        
-        return {
-            'accountAgeScore': account_age_score,
-            'activityConsistencyScore': int(activity_consistency),
-            'engagementScore': int(engagement_score),
-            'overallQualityScore': int(overall_quality),
-            'dataCompletenessScore': data_quality.get('completeness_percentage', 0)
-        }
+        engagement_score = activity_score
+        if engagement_score > 100:
+            engagement_score = 100
+        
+        return HistoryMetrics(
+            accountAgeScore=account_age_score,
+            activityConsistencyScore=int(activity_consistency),
+            engagementScore=int(engagement_score),
+            overallQualityScore=int(overall_quality),
+            dataCompletenessScore=data_quality.get('completeness_percentage', 0)
+        )
     
     def _calculate_portfolio_volatility(self, raw_data: Dict) -> float:
         """Calculate portfolio volatility estimate"""
@@ -346,119 +813,76 @@ class DataProcessor:
         user_category = user_analytics.get('user_category', 'newcomer')
         
         # Map user categories to volatility estimates
-        volatility_map = {
-            'whale_power_user': 15,
-            'advanced_defi_user': 25,
-            'active_defi_user': 30,
-            'staking_focused_user': 20,
-            'active_crypto_user': 35,
-            'casual_user': 40,
-            'newcomer': 50
-        }
-        
-        return volatility_map.get(user_category, 40)
+        return _portfolio_volatility(user_category)
     
     def _get_risk_category_score(self, user_category: str) -> int:
         """Get risk score based on user category"""
         
-        risk_scores = {
-            'whale_power_user': 90,
-            'advanced_defi_user': 75,
-            'active_defi_user': 65,
-            'staking_focused_user': 80,
-            'active_crypto_user': 60,
-            'casual_user': 50,
-            'newcomer': 40
-        }
-        
-        return risk_scores.get(user_category, 40)
+        return _risk_score(user_category)
     
-    def _calculate_meta_metrics(self, raw_data: Dict) -> Dict[str, Any]:
+    def _calculate_meta_metrics(self, raw_data: Dict,
+                                collection_stats: Optional[Tuple[int, int, float]] = None) -> MetaMetrics:
         """Calculate meta-metrics about the data collection process"""
         
-        collection_status = raw_data.get('collection_status', {})
-        
-        successful_sources = sum(1 for status in collection_status.values() 
-                               if status.get('success', False))
-        
-        total_collection_time = sum(status.get('collection_time', 0) 
-                                  for status in collection_status.values())
+        if collection_stats is None:
+            collection_stats = _collection_stats(raw_data.get('collection_status', {}))
+        successful_sources, total_sources, total_collection_time = collection_stats
         
-        return {
-            'successfulSources': successful_sources,
-            'totalSources': len(collection_status),
-            'successRate': int((successful_sources / max(1, len(collection_status))) * 100),
-            'totalCollectionTime': int(total_collection_time),
-            'averageCollectionTime': int(total_collection_time / max(1, len(collection_status)))
-        }
+        return MetaMetrics(
+            successfulSources=successful_sources,
+            totalSources=total_sources,
+            successRate=int((successful_sources / max(1, total_sources)) * 100),
+            totalCollectionTime=int(total_collection_time),
+            averageCollectionTime=int(total_collection_time / max(1, total_sources))
+        )
     
     def _format_for_smart_contract(self, behavioral_metrics: Dict) -> Dict[str, int]:
         """Format behavioral metrics for smart contract consumption"""
         
-        tx_metrics = behavioral_metrics['transaction_metrics']
-        defi_metrics = behavioral_metrics['defi_metrics']
-        staking_metrics = behavioral_metrics['staking_metrics']
-        risk_metrics = behavioral_metrics['risk_metrics']
-        history_metrics = behavioral_metrics['history_metrics']
-        
-        # Ensure all values are integers for Solidity compatibility
-        contract_metrics = {
-            # Transaction metrics (uint256)
-            'transactionFrequency': int(tx_metrics['transactionFrequency']),
-            'averageTransactionValue': int(tx_metrics['averageTransactionValue']),
-            'gasEfficiencyScore': int(tx_metrics['gasEfficiencyScore']),
-            'crossChainActivityCount': int(tx_metrics['crossChainActivityCount']),
-            'consistencyMetric': int(tx_metrics['consistencyMetric']),
-            
-            # DeFi metrics (uint256)
-            'protocolInteractionCount': int(defi_metrics['protocolInteractionCount']),
-            'totalDeFiBalanceUSD': int(defi_metrics['totalDeFiBalanceUSD']),
-            'liquidityPositionCount': int(defi_metrics['liquidityPositionCount']),
-            'protocolDiversityScore': int(defi_metrics['protocolDiversityScore']),
-            'interactionDepthScore': int(defi_metrics['interactionDepthScore']),
-            'yieldFarmingActive': int(defi_metrics['yieldFarmingActive']),
-            
-            # Staking metrics (uint256)
-            'totalStakedUSD': int(staking_metrics['totalStakedUSD']),
-            'stakingDurationDays': int(staking_metrics['stakingDurationDays']),
-            'stakingPlatformCount': int(staking_metrics['stakingPlatformCount']),
-            'rewardClaimFrequency': int(staking_metrics['rewardClaimFrequency']),
-            'stakingLoyaltyScore': int(staking_metrics['stakingLoyaltyScore']),
-            'platformDiversityScore': int(staking_metrics['platformDiversityScore']),
-            
-            # Risk metrics (uint256)
-            'liquidationEventCount': int(risk_metrics['liquidationEventCount']),
-            'leverageRatio': int(risk_metrics['leverageRatio']),
-            'portfolioVolatility': int(risk_metrics['portfolioVolatility']),
-            
-            # History metrics (uint256)
-            'accountAgeScore': int(history_metrics['accountAgeScore']),
-            'activityConsistencyScore': int(history_metrics['activityConsistencyScore']),
-            'engagementScore': int(history_metrics['engagementScore'])
-        }
-        
-        # Validate all values are within acceptable ranges
-        for key, value in contract_metrics.items():
-            if not isinstance(value, int):
-                logger.warning(f"Non-integer value found for {key}: {value}")
-                contract_metrics[key] = int(value)
-            
-            # Ensure non-negative values
-            if value < 0:
-                logger.warning(f"Negative value found for {key}: {value}")
-                contract_metrics[key] = 0
-            
-            # Cap extremely large values
-            if value > 1_000_000_000:  # 1 billion cap
-                logger.warning(f"Extremely large value capped for {key}: {value}")
-                contract_metrics[key] = 1_000_000_000
+        # Pull each source's contract fields in one call, in contract order
+        values = (
+            _get_tx_contract_fields(behavioral_metrics['transaction_metrics'])
+            + _get_defi_contract_fields(behavioral_metrics['defi_metrics'])
+            + _get_staking_contract_fields(behavioral_metrics['staking_metrics'])
+            + _get_risk_contract_fields(behavioral_metrics['risk_metrics'])
+            + _get_history_contract_fields(behavioral_metrics['history_metrics'])
+        )
         
-        return contract_metrics
+        # Clamp to [0, 1 billion] in one pass, staged as float64 so values beyond int64 can't overflow
+        # before the clip, then convert to integers for Solidity compatibility
+        keys = _CONTRACT_FIELDS
+        staged = np.fromiter(values, dtype=np.float64, count=len(keys))
+        # NaN/inf would survive the clip and wrap in the int64 cast - fail so the caller uses the fallback metrics
+        if not np.isfinite(staged).all():
+            raise ValueError("Non-finite contract value")
+        clipped = np.empty_like(staged)
+        np.clip(staged, 0, _CONTRACT_VALUE_CAP, out=clipped)
+        integers = clipped.astype(np.int64).tolist()
+        
+        # Only walk the fields when something was actually clamped
+        if (clipped != staged).any():
+            for key, original, value in zip(keys, values, integers):
+                if original < 0 or original > _CONTRACT_VALUE_CAP:
+                    logger.warning(f"Out-of-range value clamped for {key}: {original} -> {value}")
+        
+        return dict(zip(keys, integers))
     
     def _generate_processing_metadata(self, raw_data: Dict, behavioral_metrics: Dict, 
                                     contract_metrics: Dict, data_quality: Dict) -> Dict[str, Any]:
         """Generate comprehensive processing metadata"""
         
+        # Single sweep over the contract values for all validation flags and the total
+        all_integers = no_negative_values = within_bounds = True
+        total_score_preview = 0
+        for value in contract_metrics.values():
+            if not isinstance(value, int):
+                all_integers = False
+            if value < 0:
+                no_negative_values = False
+            elif value > _CONTRACT_VALUE_CAP:
+                within_bounds = False
+            total_score_preview += value
+        
         return {
             'processing_status': 'success',
             'processing_timestamp': datetime.now().isoformat(),
@@ -471,13 +895,13 @@ class DataProcessor:
             'processing_summary': {
                 'metrics_extracted': len(behavioral_metrics),
                 'contract_metrics_count': len(contract_metrics),
-                'total_score_preview': sum(contract_metrics.values()),
+                'total_score_preview': total_score_preview,
                 'processing_version': '1.0.0'
             },
             'validation_results': {
-                'all_integers': all(isinstance(v, int) for v in contract_metrics.values()),
-                'no_negative_values': all(v >= 0 for v in contract_metrics.values()),
-                'within_bounds': all(v <= 1_000_000_000 for v in contract_metrics.values())
+                'all_integers': all_integers,
+                'no_negative_values': no_negative_values,
+                'within_bounds': within_bounds
             },
             'recommendations': self._generate_recommendations(behavioral_metrics, data_quality),
             'fallback_used': False
@@ -486,67 +910,21 @@ class DataProcessor:
     def _generate_recommendations(self, behavioral_metrics: Dict, data_quality: Dict) -> List[str]:
         """Generate recommendations based on processed data"""
         
-        recommendations = []
-        
-        # Data quality recommendations
-        if data_quality['quality_score'] < 70:
-            recommendations.append("Consider improving data collection completeness")
-        
-        if data_quality['successful_sources'] < 2:
-            recommendations.append("Multiple data sources recommended for better accuracy")
-        
-        # Behavioral recommendations
-        tx_metrics = behavioral_metrics['transaction_metrics']
-        if tx_metrics['transactionFrequency'] < 10:
-            recommendations.append("Low transaction activity may affect score accuracy")
-        
-        defi_metrics = behavioral_metrics['defi_metrics']
-        if defi_metrics['protocolInteractionCount'] == 0:
-            recommendations.append("DeFi interaction data missing - consider protocol engagement")
-        
-        staking_metrics = behavioral_metrics['staking_metrics']
-        if staking_metrics['totalStakedUSD'] == 0:
-            recommendations.append("No staking activity detected - consider staking for credit building")
+        # One bit per triggered recommendation, in _RECOMMENDATIONS order
+        mask = (
+            (data_quality['quality_score'] < 70)
+            | (data_quality['successful_sources'] < 2) << 1
+            | (behavioral_metrics['transaction_metrics'].transactionFrequency < 10) << 2
+            | (behavioral_metrics['defi_metrics'].protocolInteractionCount == 0) << 3
+            | (behavioral_metrics['staking_metrics'].totalStakedUSD == 0) << 4
+        )
         
-        return recommendations
+        return [message for bit, message in enumerate(_RECOMMENDATIONS) if mask >> bit & 1]
     
     def _get_fallback_metrics(self) -> Dict[str, int]:
         """Return safe fallback metrics for error cases"""
         
-        return {
-            # Transaction metrics
-            'transactionFrequency': 0,
-            'averageTransactionValue': 0,
-            'gasEfficiencyScore': 50,
-            'crossChainActivityCount': 0,
-            'consistencyMetric': 0,
-            
-            # DeFi metrics
-            'protocolInteractionCount': 0,
-            'totalDeFiBalanceUSD': 0,
-            'liquidityPositionCount': 0,
-            'protocolDiversityScore': 0,
-            'interactionDepthScore': 0,
-            'yieldFarmingActive': 0,
-            
-            # Staking metrics
-            'totalStakedUSD': 0,
-            'stakingDurationDays': 0,
-            'stakingPlatformCount': 0,
-            'rewardClaimFrequency': 0,
-            'stakingLoyaltyScore': 0,
-            'platformDiversityScore': 0,
-            
-            # Risk metrics
-            'liquidationEventCount': 0,
-            'leverageRatio': 100,
-            'portfolioVolatility': 50,
-            
-            # History metrics
-            'accountAgeScore': 0,
-            'activityConsistencyScore': 0,
-            'engagementScore': 0
-        }
+        return _FALLBACK_METRICS.copy()
     
     # Additional utility methods
     
@@ -575,6 +953,23 @@ class DataProcessor:
     def validate_contract_format(self, contract_metrics: Dict[str, int]) -> Dict[str, Any]:
         """Validate that contract metrics are properly formatted"""
         
+        # Compiled fast path for well-formed metrics - anything it rejects goes through the detailed checks
+        if _validate_contract_schema is not None:
+            try:
+                _validate_contract_schema(contract_metrics)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                total_value = sum(contract_metrics.values())
+                # The schema accepts integral floats, which the detailed checks reject
+                if type(total_value) is int:
+                    return {
+                        'is_valid': True,
+                        'issues': [],
+                        'metrics_count': len(contract_metrics),
+                        'total_value': total_value
+                    }
+        
         validation_results = {
             'is_valid': True,
             'issues': [],
@@ -582,65 +977,39 @@ class DataProcessor:
             'total_value': 0  # Will calculate after validation
         }
         
-        # Check data types
+        # Check data types and sum integer values in one pass
+        total_value = 0
         for key, value in contract_metrics.items():
             if not isinstance(value, int):
                 validation_results['is_valid'] = False
                 validation_results['issues'].append(f"{key} is not an integer: {type(value)}")
-            elif value < 0:  # Only check negative for integers
+                continue
+            if value < 0:
                 validation_results['is_valid'] = False
                 validation_results['issues'].append(f"{key} has negative value: {value}")
+            total_value += value
         
-        # Check required fields
-        required_fields = [
-            'transactionFrequency', 'averageTransactionValue', 'gasEfficiencyScore',
-            'protocolInteractionCount', 'totalDeFiBalanceUSD', 'totalStakedUSD',
-            'liquidationEventCount', 'leverageRatio', 'portfolioVolatility'
-        ]
+        validation_results['total_value'] = total_value
         
-        for field in required_fields:
-            if field not in contract_metrics:
-                validation_results['is_valid'] = False
-                validation_results['issues'].append(f"Missing required field: {field}")
-        
-        # Calculate total value safely (only for integer values)
-        try:
-            validation_results['total_value'] = sum(v for v in contract_metrics.values() if isinstance(v, int))
-        except Exception:
-            validation_results['total_value'] = 0
+        # Check required fields
+        missing_fields = _REQUIRED_FIELDS.difference(contract_metrics)
+        if missing_fields:
+            validation_results['is_valid'] = False
+            validation_results['issues'].extend(
+                f"Missing required field: {field}" for field in sorted(missing_fields)
+            )
         
         return validation_results
     
     def _convert_to_behavioral_metrics_format(self, contract_metrics: Dict[str, int], processing_metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Convert contract metrics back to BehavioralMetrics format for contract bridge"""
         
-        return {
-            'transactionFrequency': contract_metrics.get('transactionFrequency', 0),
-            'averageTransactionValue': contract_metrics.get('averageTransactionValue', 0),
-            'gasEfficiencyScore': contract_metrics.get('gasEfficiencyScore', 50),
-            'crossChainActivityCount': contract_metrics.get('crossChainActivityCount', 0),
-            'consistencyMetric': contract_metrics.get('consistencyMetric', 0),
-            'protocolInteractionCount': contract_metrics.get('protocolInteractionCount', 0),
-            'totalDeFiBalanceUSD': contract_metrics.get('totalDeFiBalanceUSD', 0),
-            'liquidityPositionCount': contract_metrics.get('liquidityPositionCount', 0),
-            'protocolDiversityScore': contract_metrics.get('protocolDiversityScore', 0),
-            'interactionDepthScore': contract_metrics.get('interactionDepthScore', 0),
-            'yieldFarmingActive': contract_metrics.get('yieldFarmingActive', 0),
-            'totalStakedUSD': contract_metrics.get('totalStakedUSD', 0),
-            'stakingDurationDays': contract_metrics.get('stakingDurationDays', 0),
-            'stakingPlatformCount': contract_metrics.get('stakingPlatformCount', 0),
-            'rewardClaimFrequency': contract_metrics.get('rewardClaimFrequency', 0),
-            'stakingLoyaltyScore': contract_metrics.get('stakingLoyaltyScore', 0),
-            'platformDiversityScore': contract_metrics.get('platformDiversityScore', 0),
-            'liquidationEventCount': contract_metrics.get('liquidationEventCount', 0),
-            'leverageRatio': contract_metrics.get('leverageRatio', 100),
-            'portfolioVolatility': contract_metrics.get('portfolioVolatility', 50),
-            'riskScore': contract_metrics.get('riskScore', 50),
-            'accountAge': contract_metrics.get('accountAge', 0),
-            'lastActivityDays': contract_metrics.get('lastActivityDays', 0),
-            'engagementScore': contract_metrics.get('engagementScore', 50),
-            'dataQuality': processing_metadata.get('data_quality', {}).get('quality_score', 50)
+        behavioral_metrics = {
+            field: contract_metrics.get(field, default)
+            for field, default in _BEHAVIORAL_METRICS_DEFAULTS.items()
         }
+        behavioral_metrics['dataQuality'] = processing_metadata.get('data_quality', {}).get('quality_score', 50)
+        return behavioral_metrics
 
 # Test implementation
 async def test_data_processor():
@@ -671,6 +1040,29 @@ async def test_data_processor():
             for issue in validation['issues']:
                 print(f"   - {issue}")
         
+        # Batch kernels must score exactly like the per-address path
+        raw_data = await processor._fetch_raw_data(test_address)
+        parity_inputs = [raw_data, {}]
+        batch_metrics = processor._process_source_metrics_batch(parity_inputs)
+        for raw, batch in zip(parity_inputs, batch_metrics):
+            structured = raw.get('structured_metrics', {})
+            collection_status = raw.get('collection_status', {})
+            single = (
+                processor._process_transaction_data(
+                    structured.get('transaction_metrics', {}), collection_status.get('alchemy', {})
+                ),
+                processor._process_defi_data(
+                    structured.get('defi_metrics', {}), collection_status.get('zapper', {})
+                ),
+                processor._process_staking_data(
+                    structured.get('staking_metrics', {}), collection_status.get('moralis', {})
+                )
+            )
+            if batch != single:
+                print(f"❌ Batch/single mismatch:\n   batch:  {batch}\n   single: {single}")
+                return False
+        print("✅ Batch/single scoring parity: PASS")
+        
         # Preview functionality
         preview = await processor.preview_contract_data(test_address)
         print(f"✅ Preview generated successfully")
@@ -679,8 +1071,7 @@ async def test_data_processor():
         
     except Exception as e:
         print(f"❌ Data processor test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Data processor test traceback")
         return False
 
 if __name__ == "__main__":
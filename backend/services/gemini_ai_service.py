@@ -1,120 +1,175 @@
 # backend/services/gemini-ai-service.py
 
 import google.generativeai as genai
+import asyncio
 import os
 import json
-from typing import Dict, Any
+import time
+from collections import OrderedDict
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from loguru import logger
 
+GEMINI_MODEL_NAME = 'gemini-1.5-flash'
+
+# Only the first SUMMARY_MAX_CHARS characters are returned, so cap generation at roughly that length
+SUMMARY_MAX_CHARS = 200
+_GENERATION_CONFIG = {"max_output_tokens": 80}
+
+# Gemini analyses are reused for identical score profiles, bounded in size and age
+ANALYSIS_CACHE_SIZE = 4096
+ANALYSIS_CACHE_TTL = 3600
+
+# Score fields that make up the analysis prompt, and so the response cache key
+_PROMPT_FIELDS = ('total_score', 'transaction_score', 'defi_score', 'staking_score', 'risk_score', 'history_score')
+
+# Bound str.format of the Gemini analysis prompt, filled from score_data
+_PROMPT_TEMPLATE = """
+Analyze this DeFi credit profile as a financial expert. Include risk assessment:
+
+Credit Score: {total_score} (Range: 300-850)
+Components:
+- Transaction Score: {transaction_score}/100
+- DeFi Score: {defi_score}/100
+- Staking Score: {staking_score}/100
+- Risk Score: {risk_score}/100
+- History Score: {history_score}/100
+
+Provide a brief analysis including risk level and lending suitability.
+""".format
+
+def _make_buckets(*buckets):
+    """Split (inclusive lower bound, label) pairs into parallel bound/label tuples"""
+    return tuple(bound for bound, _ in buckets), tuple(label for _, label in buckets)
+
+# Credit rating by total score and risk level by risk score, lowest bucket first
+_RATING_BUCKETS = _make_buckets((0, "poor"), (580, "fair"), (670, "good"), (750, "excellent"))
+_RISK_BUCKETS = _make_buckets((0, "low"), (60, "moderate"), (80, "high"))
+
+_RATING_RECOMMENDATIONS = {
+    "excellent": "approved",
+    "good": "approved",
+    "fair": "conditional",
+    "poor": "declined"
+}
+
+# Deterministic summary per rating, filled with the risk level
+_SUMMARIES = {
+    "excellent": "Excellent credit profile with {risk_level} risk for DeFi lending.",
+    "good": "Good credit profile with {risk_level} risk for DeFi lending.",
+    "fair": "Fair credit profile with {risk_level} risk - careful evaluation needed.",
+    "poor": "Limited credit profile with {risk_level} risk - high caution advised."
+}
+
+def _bucket(value, buckets) -> str:
+    """Label of the highest bucket whose lower bound is <= value (values below every bound get the first label)"""
+    bounds, labels = buckets
+    return labels[max(bisect_right(bounds, value) - 1, 0)]
+
+def _risk_level(risk_score) -> str:
+    """Risk level for a risk score - very_high is strictly above 100, unlike the inclusive bucket bounds"""
+    return "very_high" if risk_score > 100 else _bucket(risk_score, _RISK_BUCKETS)
+
+@lru_cache(maxsize=1024)
+def _fallback_analysis(total_score, risk_score) -> Dict[str, Any]:
+    """Deterministic analysis for a score pair - treat the cached result as read-only"""
+    
+    rating = _bucket(total_score, _RATING_BUCKETS)
+    risk_level = _risk_level(risk_score)
+    
+    return {
+        "rating": rating,
+        "risk_level": risk_level,
+        "score": total_score,
+        "recommendation": _RATING_RECOMMENDATIONS[rating],
+        "summary": _SUMMARIES[rating].format(risk_level=risk_level)
+    }
+
+@lru_cache(maxsize=1)
+def _get_model() -> genai.GenerativeModel:
+    """Configure Gemini once and share the model (and its connection) across all service instances"""
+    # Use Gemini-1.0-Pro model (free tier)
+    api_key = "<YOUR_GEMINI_API_KEY>"
+    if not api_key:
+        raise ValueError("GEMINI_AI_API_KEY environment variable is required")
+    
+    genai.configure(api_key=api_key)
+    # Updated to use the correct model name
+    return genai.GenerativeModel(GEMINI_MODEL_NAME)
+
 class GeminiAIService:
-    def __init__(self):
-        # Use Gemini-1.0-Pro model (free tier)
-        api_key = "<YOUR_GEMINI_API_KEY>"
-        if not api_key:
-            raise ValueError("GEMINI_AI_API_KEY environment variable is required")
+    def __init__(self, use_llm: Optional[bool] = None):
+        # Gemini is opt-in - by default analyses come from the deterministic scoring rules
+        if use_llm is None:
+            use_llm = os.getenv('GEMINI_USE_LLM', 'false').lower() == 'true'
+        self.use_llm = use_llm
         
-        genai.configure(api_key=api_key)
-        # Updated to use the correct model name
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        # Only touch the Gemini API key when LLM analyses are enabled
+        self.model = _get_model() if use_llm else None
+        
+        # LRU of (cached_at, analysis) keyed by model name plus prompt scores
+        self._analysis_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
-    async def analyze_credit_score(self, score_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze_credit_score(self, score_data: Dict[str, Any], use_llm: Optional[bool] = None) -> Dict[str, Any]:
         """Analyze credit score data and provide AI-enhanced insights in simple JSON format"""
+        if not (self.use_llm if use_llm is None else use_llm):
+            return self._get_fallback_analysis(score_data)
+        
+        cache_key = (GEMINI_MODEL_NAME,) + tuple(score_data.get(field) for field in _PROMPT_FIELDS)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] <= ANALYSIS_CACHE_TTL:
+                self._analysis_cache.move_to_end(cache_key)
+                return dict(cached[1])
+            del self._analysis_cache[cache_key]
+        
         try:
+            # A per-call use_llm=True may need the model when the service default is off
+            if self.model is None:
+                self.model = _get_model()
+            
             prompt = self._generate_analysis_prompt(score_data)
-            response = self.model.generate_content(prompt)
+            # Don't block the event loop for the Gemini round-trip
+            if hasattr(self.model, 'generate_content_async'):
+                response = await self.model.generate_content_async(prompt, generation_config=_GENERATION_CONFIG)
+            else:
+                response = await asyncio.to_thread(
+                    self.model.generate_content, prompt, generation_config=_GENERATION_CONFIG
+                )
             
             # Convert text response to simple JSON structure
-            return self._convert_to_simple_json(response.text, score_data)
+            analysis = self._convert_to_simple_json(response.text, score_data)
+            
+            self._analysis_cache[cache_key] = (time.monotonic(), analysis)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            
+            return dict(analysis)
             
         except Exception as e:
             logger.error(f"Gemini AI analysis failed: {str(e)}")
             return self._get_fallback_analysis(score_data)
 
     def _generate_analysis_prompt(self, score_data: Dict[str, Any]) -> str:
-        return f"""
-        Analyze this DeFi credit profile as a financial expert. Include risk assessment:
-
-        Credit Score: {score_data['total_score']} (Range: 300-850)
-        Components:
-        - Transaction Score: {score_data['transaction_score']}/100
-        - DeFi Score: {score_data['defi_score']}/100
-        - Staking Score: {score_data['staking_score']}/100
-        - Risk Score: {score_data['risk_score']}/100
-        - History Score: {score_data['history_score']}/100
-
-        Provide a brief analysis including risk level and lending suitability.
-        """
+        return _PROMPT_TEMPLATE(**score_data)
 
     def _convert_to_simple_json(self, ai_text: str, score_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert AI text to simple JSON with 5 key-value pairs"""
         
         total_score = score_data['total_score']
-        risk_score = score_data['risk_score']
-        
-        # Determine simple ratings
-        if total_score >= 750:
-            rating = "excellent"
-            risk_level = "low"
-        elif total_score >= 670:
-            rating = "good"
-            risk_level = "moderate"
-        elif total_score >= 580:
-            rating = "fair"
-            risk_level = "moderate"
-        else:
-            rating = "poor"
-            risk_level = "high"
-        
-        # Override risk level if risk score is very high
-        if risk_score > 100:
-            risk_level = "very_high"
-        elif risk_score > 80:
-            risk_level = "high"
+        rating = _bucket(total_score, _RATING_BUCKETS)
         
         return {
             "rating": rating,
-            "risk_level": risk_level,
+            "risk_level": _risk_level(score_data['risk_score']),
             "score": total_score,
-            "recommendation": "approved" if rating in ["excellent", "good"] else "conditional" if rating == "fair" else "declined",
-            "summary": ai_text[:200] + "..." if len(ai_text) > 200 else ai_text
+            "recommendation": _RATING_RECOMMENDATIONS[rating],
+            "summary": f"{ai_text[:SUMMARY_MAX_CHARS]}..." if len(ai_text) > SUMMARY_MAX_CHARS else ai_text
         }
 
     def _get_fallback_analysis(self, score_data: Dict[str, Any]) -> Dict[str, Any]:
         """Return fallback analysis as JSON object"""
         
-        total_score = score_data['total_score']
-        risk_score = score_data['risk_score']
-        
-        if risk_score > 100:
-            risk_level = "very_high"
-        elif risk_score >= 80:
-            risk_level = "high"
-        elif risk_score >= 60:
-            risk_level = "moderate"
-        else:
-            risk_level = "low"
-        
-        if total_score >= 750:
-            rating = "excellent"
-            recommendation = "approved"
-            summary = f"Excellent credit profile with {risk_level} risk for DeFi lending."
-        elif total_score >= 670:
-            rating = "good"
-            recommendation = "approved"
-            summary = f"Good credit profile with {risk_level} risk for DeFi lending."
-        elif total_score >= 580:
-            rating = "fair"
-            recommendation = "conditional"
-            summary = f"Fair credit profile with {risk_level} risk - careful evaluation needed."
-        else:
-            rating = "poor"
-            recommendation = "declined"
-            summary = f"Limited credit profile with {risk_level} risk - high caution advised."
-        
-        return {
-            "rating": rating,
-            "risk_level": risk_level,
-            "score": total_score,
-            "recommendation": recommendation,
-            "summary": summary
-        }
+        # Copy so callers can't mutate the cached result
+        return dict(_fallback_analysis(score_data['total_score'], score_data['risk_score']))
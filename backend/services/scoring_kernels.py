@@ -0,0 +1,78 @@
+# backend/services/scoring_kernels.py
+
+import numpy as np
+
+# Numba is optional - without it the kernels run as plain Python loops
+try:
+    from numba import config, njit, prange
+    # Kernels are launched from worker threads (asyncio.to_thread), and the TBB layer hangs
+    # interpreter shutdown when first started off the main thread - prefer OpenMP
+    # (NUMBA_THREADING_LAYER still overrides this)
+    config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+    prange = range
+
+# Column order of each kernel's output rows
+TX_SCORE_COLUMNS = (
+    'transactionFrequency', 'averageTransactionValue', 'gasEfficiencyScore',
+    'crossChainActivityCount', 'consistencyMetric'
+)
+DEFI_SCORE_COLUMNS = (
+    'protocolInteractionCount', 'totalDeFiBalanceUSD', 'liquidityPositionCount',
+    'protocolDiversityScore', 'interactionDepthScore', 'yieldFarmingActive',
+    'protocolInteractionScore'
+)
+STAKING_SCORE_COLUMNS = (
+    'totalStakedUSD', 'stakingDurationDays', 'stakingPlatformCount',
+    'rewardClaimFrequency', 'stakingLoyaltyScore', 'platformDiversityScore'
+)
+
+@njit(cache=True)
+def _clip(value, low, high):
+    return low if value < low else (high if value > high else value)
+
+@njit(parallel=True, cache=True)
+def compute_tx_scores(monthly, avg_value, gas_efficiency, chains, consistency, cap):
+    """Transaction scores for a batch of users, one row per user (see TX_SCORE_COLUMNS)"""
+    n = monthly.shape[0]
+    out = np.empty((n, 5), dtype=np.int64)
+    for i in prange(n):
+        out[i, 0] = int(min(100.0, monthly[i] * 2))
+        out[i, 1] = int(min(avg_value[i], cap))
+        out[i, 2] = int(gas_efficiency[i])
+        out[i, 3] = int(chains[i])
+        out[i, 4] = int(_clip(consistency[i], 0.0, 100.0))
+    return out
+
+@njit(parallel=True, cache=True)
+def compute_defi_scores(protocols, balance, lp_positions, diversity, depth, yield_farming, cap):
+    """DeFi scores for a batch of users, one row per user (see DEFI_SCORE_COLUMNS)"""
+    n = protocols.shape[0]
+    out = np.empty((n, 7), dtype=np.int64)
+    for i in prange(n):
+        out[i, 0] = int(protocols[i])
+        out[i, 1] = int(min(balance[i], cap))
+        out[i, 2] = int(lp_positions[i])
+        out[i, 3] = int(_clip(diversity[i], 0.0, 100.0))
+        out[i, 4] = int(_clip(depth[i], 0.0, 100.0))
+        out[i, 5] = 1 if yield_farming[i] != 0 else 0
+        out[i, 6] = int(min(100.0, protocols[i] * 10))
+    return out
+
+@njit(parallel=True, cache=True)
+def compute_staking_scores(staked, duration_days, platforms, claims, loyalty, cap):
+    """Staking scores for a batch of users, one row per user (see STAKING_SCORE_COLUMNS)"""
+    n = staked.shape[0]
+    out = np.empty((n, 6), dtype=np.int64)
+    for i in prange(n):
+        out[i, 0] = int(min(staked[i], cap))
+        out[i, 1] = int(duration_days[i])
+        out[i, 2] = int(platforms[i])
+        out[i, 3] = int(claims[i])
+        out[i, 4] = int(loyalty[i])
+        out[i, 5] = int(min(100.0, platforms[i] * 20))
+    return out
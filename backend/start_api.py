@@ -2,12 +2,45 @@
 
 import os
 import sys
-from dotenv import load_dotenv
+from types import MappingProxyType
+from dotenv import load_dotenv, dotenv_values
+
+# uvloop and httptools come with uvicorn[standard]; fall back to asyncio/h11 without them
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import httptools
+except ImportError:
+    httptools = None
+
+def _load_env():
+    """Parse .env once and overlay the process environment, frozen against mutation"""
+    
+    env = {name: value for name, value in dotenv_values().items() if value is not None}
+    env.update(os.environ)
+    return MappingProxyType(env)
+
+# Environment values (.env overridden by os.environ), read once at import
+_ENV = _load_env()
+
+def get_env(name, default=None):
+    """Return an environment variable from the preloaded environment"""
+    
+    return _ENV.get(name, default)
+
+def clear_cache():
+    """Re-read .env and os.environ, e.g. after tests modify the environment"""
+    
+    global _ENV
+    _ENV = _load_env()
 
 def check_environment():
     """Check if environment is properly configured"""
     
-    # Load environment variables
+    # Load environment variables into os.environ for the API modules
     load_dotenv()
     
     print("🔧 Checking environment configuration...")
@@ -20,7 +53,7 @@ def check_environment():
     
     missing_vars = []
     for var, description in required_vars.items():
-        value = os.getenv(var)
+        value = get_env(var)
         if value:
             print(f"   ✅ {var}: {'*' * 10}...{value[-4:]}")
         else:
@@ -42,13 +75,8 @@ def check_environment():
     print("✅ Environment configuration looks good!")
     return True
 
-def start_api():
-    """Start the API server"""
-    
-    if not check_environment():
-        sys.exit(1)
-    
-    print("\n🚀 Starting Credit Score API...")
+def start_dev():
+    """Start a single auto-reloading Uvicorn server for development"""
     
     # Import and run the API
     try:
@@ -65,12 +93,49 @@ def start_api():
             host="0.0.0.0",
             port=8000,
             reload=True,
-            log_level="info"
+            loop="uvloop" if uvloop else "asyncio",
+            http="httptools" if httptools else "h11",
+            access_log=get_env('API_ACCESS_LOG', 'true').lower() == 'true',
+            log_level=get_env('API_LOG_LEVEL', 'info')
         )
         
     except Exception as e:
         print(f"❌ Failed to start API: {e}")
         sys.exit(1)
 
+def start_prod():
+    """Start Gunicorn with one Uvicorn worker per CPU core for production"""
+    
+    workers = str(os.cpu_count() or 1)
+    
+    print(f"🌐 Starting {workers} Gunicorn workers at http://0.0.0.0:8000")
+    
+    try:
+        os.execvp("gunicorn", [
+            "gunicorn", "api.credit_score_api:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", workers,
+            "--bind", "0.0.0.0:8000",
+            "--keep-alive", "5",
+            "--log-level", get_env('API_LOG_LEVEL', 'warning')
+        ])
+        
+    except OSError as e:
+        print(f"❌ Failed to start Gunicorn: {e}")
+        sys.exit(1)
+
+def start_api():
+    """Start the API server - APP_ENV=production runs Gunicorn, anything else the dev server"""
+    
+    if not check_environment():
+        sys.exit(1)
+    
+    print("\n🚀 Starting Credit Score API...")
+    
+    if get_env('APP_ENV', 'development').lower() == 'production':
+        start_prod()
+    else:
+        start_dev()
+
 if __name__ == "__main__":
     start_api()
\ No newline at end of file
@@ -0,0 +1,9 @@
+# backend/tests/conftest.py
+
+import os
+import sys
+
+# Make the backend packages (clients, services, api) importable from the tests
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
@@ -0,0 +1,136 @@
+# backend/tests/test_contract_bridge.py
+
+from types import SimpleNamespace
+
+import pytest
+from eth_account import Account
+
+from services.contract_bridge import BehavioralMetrics, ContractBridge, CreditScore
+
+REGISTRY_ADDRESS = "0x8e9288aD536Ee22Df91026BE96cB1deE904C05eF"
+USERS = [
+    "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045",
+    "0x742d35Cc6654c967e5c749CB1b5B43cA2E9b0b70",
+    "0xcA11bde05977b3631167028862bE2a173976CA11"
+]
+START_NONCE = 7
+
+class StubProvider:
+    """Answers each make_batch_request call with the next queued response"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def make_batch_request(self, requests):
+        self.requests.append(requests)
+        return self.responses.pop(0)
+
+class StubEth:
+    gas_price = 100_000_000
+
+    def __init__(self):
+        self.awaited = []
+
+    def get_transaction_count(self, address, block_identifier):
+        return START_NONCE
+
+    def wait_for_transaction_receipt(self, tx_hash, timeout, poll_latency):
+        self.awaited.append(tx_hash)
+        return SimpleNamespace(status=1)
+
+def _make_bridge(provider):
+    # Only the attributes bulk_update_behavioral_data reads - no RPC connection
+    bridge = ContractBridge.__new__(ContractBridge)
+    bridge.w3 = SimpleNamespace(eth=StubEth(), provider=provider)
+    bridge.account = Account.create()
+    bridge.registry_address = REGISTRY_ADDRESS
+    bridge.chain_id = 534351
+    bridge.gas_price = 100_000_000
+    bridge.gas_limit = 500_000
+    bridge.receipt_timeout = 5
+    bridge.block_time = 0
+
+    # Record every transaction the bridge signs
+    bridge.signed = []
+    sign_transaction = bridge._sign_transaction
+    def recording_sign(transaction):
+        bridge.signed.append(transaction)
+        return sign_transaction(transaction)
+    bridge._sign_transaction = recording_sign
+    return bridge
+
+def _users_metrics():
+    return [(user, BehavioralMetrics(*range(22))) for user in USERS]
+
+@pytest.mark.asyncio
+async def test_bulk_update_fills_gap_left_by_rejected_middle_transaction():
+    provider = StubProvider(
+        [{'result': '0xaa'}, {'error': {'code': -32000, 'message': 'underpriced'}}, {'result': '0xcc'}],
+        [{'result': '0xdd'}]
+    )
+    bridge = _make_bridge(provider)
+
+    results = await bridge.bulk_update_behavioral_data(_users_metrics())
+
+    assert [result['success'] for result in results] == [True, False, True]
+    assert 'underpriced' in results[1]['error']
+    assert bridge.w3.eth.awaited == ['0xaa', '0xcc']
+
+    # One zero-value self-transfer at the rejected nonce, submitted as its own batch
+    assert len(provider.requests) == 2 and len(provider.requests[1]) == 1
+    filler = bridge.signed[-1]
+    assert filler['nonce'] == START_NONCE + 1
+    assert filler['to'] == bridge.account.address
+    assert filler['value'] == 0 and filler['gas'] == 21000
+
+@pytest.mark.asyncio
+async def test_bulk_update_drops_transactions_behind_an_unfillable_gap():
+    provider = StubProvider(
+        [{'result': '0xaa'}, {'error': {'message': 'underpriced'}}, {'result': '0xcc'}],
+        [{'error': {'message': 'nonce too low'}}]
+    )
+    bridge = _make_bridge(provider)
+
+    results = await bridge.bulk_update_behavioral_data(_users_metrics())
+
+    assert [result['success'] for result in results] == [True, False, False]
+    assert results[2]['error'] == f"Not mined - nonce {START_NONCE + 1} could not be filled"
+    assert bridge.w3.eth.awaited == ['0xaa']
+
+@pytest.mark.asyncio
+async def test_bulk_update_reports_whole_batch_rejection():
+    provider = StubProvider({'jsonrpc': '2.0', 'id': None, 'error': {'message': 'batch too large'}})
+    bridge = _make_bridge(provider)
+
+    results = await bridge.bulk_update_behavioral_data(_users_metrics())
+
+    assert not any(result['success'] for result in results)
+    assert all('batch rejected' in result['error'] for result in results)
+    assert bridge.w3.eth.awaited == []
+
+@pytest.mark.asyncio
+async def test_full_flow_reads_score_directly_without_multicall3(monkeypatch):
+    bridge = _make_bridge(StubProvider())
+
+    async def no_wait(seconds):
+        pass
+    async def sent(*args):
+        return '0xaa'
+    async def multicall_missing(user_address):
+        raise ValueError("execution reverted")
+    async def credit_score(user_address):
+        return CreditScore(*range(10))
+    async def score_history(user_address):
+        return [700]
+    bridge.update_behavioral_data = bridge.calculate_credit_score = sent
+    bridge.get_credit_score_with_history = multicall_missing
+    bridge.get_credit_score = credit_score
+    bridge.get_score_history = score_history
+    monkeypatch.setattr('services.contract_bridge.asyncio.sleep', no_wait)
+
+    result = await bridge.full_score_calculation_flow(USERS[0], {})
+
+    assert result['success']
+    assert result['credit_score']['totalScore'] == 0
+    assert result['score_history'] == [700]
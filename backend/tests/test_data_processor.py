@@ -0,0 +1,112 @@
+# backend/tests/test_data_processor.py
+
+import pytest
+
+from services import data_processor
+from services.data_processor import DataProcessor
+
+# Raw aggregator payloads covering capped, clipped, missing and failed-source inputs
+IN_RANGE_SAMPLES = [
+    {
+        'collection_status': {'alchemy': {'success': True}, 'zapper': {'success': True}, 'moralis': {'success': True}},
+        'structured_metrics': {
+            'transaction_metrics': {'monthly_txn_count': 70, 'avg_value_usd': 123.4, 'gas_efficiency': 80,
+                                    'active_chains': 3, 'consistency_score': 150, 'total_transactions': 500},
+            'defi_metrics': {'unique_protocols': 12, 'total_balance_usd': 2e10, 'lp_positions': 2,
+                             'diversity_score': -5, 'interaction_depth_score': 45.7, 'yield_farming_active': 1},
+            'staking_metrics': {'total_staked_usd': 1000.9, 'avg_duration_days': 400, 'platform_count': 7,
+                                'claim_frequency': 30, 'staking_loyalty_score': 88, 'sophistication_score': 60}
+        }
+    },
+    {
+        'collection_status': {'alchemy': {'success': False}},
+        'structured_metrics': {
+            'transaction_metrics': {'monthly_txn_count': 3, 'avg_value_usd': 5e12},
+            'staking_metrics': {'platform_count': 1}
+        }
+    },
+    {}
+]
+
+# Values the kernels' int64 casts can't hold, so batches containing them are scored per address
+OUT_OF_RANGE_VALUES = [1e30, float('nan'), -2 ** 70]
+RAW_SAMPLES = IN_RANGE_SAMPLES + [
+    {'structured_metrics': {'transaction_metrics': {'monthly_txn_count': 4, 'gas_efficiency': 1e30}}}
+]
+
+@pytest.fixture
+def processor():
+    # Scoring never touches the aggregator, so skip building the API clients
+    return DataProcessor.__new__(DataProcessor)
+
+@pytest.fixture(autouse=True)
+def clear_raw_data_cache():
+    data_processor._raw_data_cache.clear()
+    yield
+    data_processor._raw_data_cache.clear()
+
+def _score_single(processor, raw_data):
+    structured = raw_data.get('structured_metrics', {})
+    collection_status = raw_data.get('collection_status', {})
+    return (
+        processor._process_transaction_data(structured.get('transaction_metrics', {}), collection_status.get('alchemy', {})),
+        processor._process_defi_data(structured.get('defi_metrics', {}), collection_status.get('zapper', {})),
+        processor._process_staking_data(structured.get('staking_metrics', {}), collection_status.get('moralis', {}))
+    )
+
+def test_batch_kernels_match_per_address_scoring(processor):
+    batch = processor._process_source_metrics_batch(IN_RANGE_SAMPLES)
+
+    assert batch == [_score_single(processor, raw_data) for raw_data in IN_RANGE_SAMPLES]
+
+def test_batch_kernels_reject_non_numeric_input(processor):
+    raw_data = {'structured_metrics': {'transaction_metrics': {'avg_value_usd': None}}}
+
+    with pytest.raises(TypeError):
+        processor._process_source_metrics_batch([RAW_SAMPLES[0], raw_data])
+
+@pytest.mark.parametrize("value", OUT_OF_RANGE_VALUES)
+def test_batch_kernels_reject_out_of_range_input(processor, value):
+    raw_data = {'structured_metrics': {'defi_metrics': {'lp_positions': value}}}
+
+    with pytest.raises(ValueError):
+        processor._process_source_metrics_batch([RAW_SAMPLES[0], raw_data])
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw_list", [
+    # None is only understood by the per-address path, so the whole batch falls back to it
+    IN_RANGE_SAMPLES + [{'structured_metrics': {'transaction_metrics': {'avg_value_usd': None}}}],
+    # As does a value the kernels' int64 casts would wrap
+    RAW_SAMPLES
+])
+async def test_process_batch_falls_back_to_per_address_scoring(processor, raw_list):
+    addresses = [f"0x{i:040x}" for i in range(len(raw_list))]
+
+    class StubAggregator:
+        async def fetch_batch_raw(self, batch_addresses):
+            return dict(zip(batch_addresses, raw_list))
+
+    processor.aggregator = StubAggregator()
+    results = await processor.process_batch(addresses)
+
+    expected = [processor._process_raw_data(address, raw_data)[0] for address, raw_data in zip(addresses, raw_list)]
+    assert [contract_metrics for contract_metrics, _ in results] == expected
+    assert all(metadata['processing_status'] == 'success' for _, metadata in results)
+
+def test_contract_values_beyond_int64_are_clamped(processor):
+    raw_data = {'structured_metrics': {'defi_metrics': {'lp_positions': -2 ** 70, 'unique_protocols': 2 ** 70}}}
+
+    contract_metrics, metadata = processor._process_raw_data("0x" + "0" * 40, raw_data)
+
+    assert metadata['processing_status'] == 'success'
+    assert contract_metrics['liquidityPositionCount'] == 0
+    assert contract_metrics['protocolInteractionCount'] == 1_000_000_000
+
+@pytest.mark.parametrize("value", [float('nan'), float('inf')])
+def test_non_finite_contract_values_use_fallback_metrics(processor, value):
+    raw_data = {'structured_metrics': {'defi_metrics': {'lp_positions': value}}}
+
+    contract_metrics, metadata = processor._process_raw_data("0x" + "0" * 40, raw_data)
+
+    assert metadata['processing_status'] == 'failed'
+    assert contract_metrics == processor._get_fallback_metrics()
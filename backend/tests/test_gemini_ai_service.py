@@ -0,0 +1,22 @@
+# backend/tests/test_gemini_ai_service.py
+
+import pytest
+
+from services.gemini_ai_service import GeminiAIService
+
+# Risk score on each side of the bucket bounds and the expected risk level
+RISK_BOUNDARIES = [(59, "low"), (60, "moderate"), (80, "high"), (100, "high"), (101, "very_high")]
+
+@pytest.fixture
+def service():
+    # Analyses below never reach Gemini, so skip configuring the model
+    return GeminiAIService(use_llm=False)
+
+@pytest.mark.parametrize("risk_score, risk_level", RISK_BOUNDARIES)
+def test_live_and_fallback_risk_levels_agree(service, risk_score, risk_level):
+    score_data = {'total_score': 700, 'risk_score': risk_score}
+
+    live = service._convert_to_simple_json("Solid profile.", score_data)
+    fallback = service._get_fallback_analysis(score_data)
+
+    assert live['risk_level'] == fallback['risk_level'] == risk_level